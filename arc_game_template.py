@@ -21,7 +21,8 @@ games without following this exact structure. See OFFICIAL_REQUIREMENTS.md.
 
 import sys
 import os
-from typing import List, Tuple, Optional, Dict
+import threading
+from typing import List, Tuple, Optional
 from enum import Enum
 
 # Auto-detect and use virtual environment for pygame
@@ -43,6 +44,8 @@ except ImportError:
         print(f"Error: pygame not found and virtual environment not available at {venv_python}")
         sys.exit(1)
 
+import numpy as np
+
 # ARC-AGI-3 OFFICIAL 16-COLOR PALETTE (indices 0-15)
 # DO NOT MODIFY - This is the official ARC color specification
 ARC_COLORS = {
@@ -67,6 +70,13 @@ ARC_COLORS = {
     15: (160, 220, 255)   # Light Blue
 }
 
+# Same palette as a (16, 3) uint8 array, so drawing indexes by cell value
+# instead of hashing into the dict (ARC_PALETTE[grid] colors a whole grid)
+ARC_PALETTE = np.array([ARC_COLORS[i] for i in range(16)], dtype=np.uint8)
+BACKGROUND_COLOR = ARC_COLORS[0]  # Black
+GRID_LINE_COLOR = ARC_COLORS[5]   # Gray
+WALL_COLOR = 1  # Blue cells block movement
+
 class Direction(Enum):
     """4 directional movement (maps to ACTION1-4)."""
     UP = (0, -1)
@@ -74,6 +84,9 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+# (dx, dy) per direction, so movement skips the Enum .value descriptor
+_DELTAS = {direction: direction.value for direction in Direction}
+
 class Action(Enum):
     """
     ARC-AGI-3 Official Action Framework
@@ -94,6 +107,41 @@ class Action(Enum):
     ACTION6 = "click"    # Click at position (requires x, y)
     ACTION7 = "undo"     # Undo (optional)
 
+# ===== MOVEMENT KERNELS =====
+# Plain loops over the int8 grid so numba can compile them. Multi-cell moves
+# (glides, push chains, line-of-sight) go here so they run at C speed when
+# numba is there; single steps go through GameTemplate.can_move_to().
+
+def _slide_until_wall(grid, px, py, dx, dy):
+    """Glide until the next cell is a wall or off the grid; returns (x, y)."""
+    height, width = grid.shape
+    while True:
+        nx = px + dx
+        ny = py + dy
+        if not (0 <= nx < width and 0 <= ny < height) or grid[ny, nx] == WALL_COLOR:
+            return px, py
+        px = nx
+        py = ny
+
+# numba is optional and slow to import; until the JIT versions are compiled
+# (see warm_up_kernels) the plain Python kernels are used
+_jit_slide_until_wall = None
+
+def warm_up_kernels():
+    """Compile the movement kernels with numba, if installed. Safe to run in a thread."""
+    global _jit_slide_until_wall
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    slide_until_wall = njit(cache=True)(_slide_until_wall)
+    slide_until_wall(np.zeros((2, 2), dtype=np.int8), 0, 0, 1, 0)
+    _jit_slide_until_wall = slide_until_wall
+
+def slide_kernel():
+    """Return slide_until_wall, JIT-compiled once it is ready."""
+    return _jit_slide_until_wall or _slide_until_wall
+
 class GameTemplate:
     """
     ARC-AGI-3 Compliant Game Template
@@ -120,7 +168,12 @@ class GameTemplate:
     10. Document in GAME_SPEC.md
     """
 
-    def __init__(self):
+    def __init__(self, headless: bool = False):
+        """
+        Args:
+            headless: Skip the window and all rendering, for agents driving
+                the game through run_headless()
+        """
         pygame.init()
 
         # ===== GAME SETTINGS - CUSTOMIZE THESE =====
@@ -140,14 +193,18 @@ class GameTemplate:
         # Screen setup
         self.screen_width = self.grid_size * self.cell_size
         self.screen_height = self.grid_size * self.cell_size
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        self.headless = headless
+        self.screen = None
+        if not headless:
+            self.setup_display()
 
         # Game state
         self.clock = pygame.time.Clock()
         self.running = True
 
         # Grid (initialize as empty - black background)
-        self.grid = [[0 for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # One int8 per cell (colors 0-15), indexed as self.grid[y, x]
+        self.grid = np.zeros((self.grid_size, self.grid_size), dtype=np.int8)
 
         # Player position (if your game has an agent)
         self.player_x = 1
@@ -167,8 +224,45 @@ class GameTemplate:
         # If targeting agent compatibility, map these to official states in your adapter.
 
         # Action history for undo (optional - only if implementing ACTION7)
-        self.action_history: List[Dict] = []
+        # Snapshots live in a preallocated ring buffer: slot i holds the grid and
+        # player position, _undo_head is the next slot to write
         self.max_history = 50  # Limit undo depth
+        self._undo_grids = np.zeros((self.max_history, self.grid_size, self.grid_size),
+                                    dtype=np.int8)
+        self._undo_pos = np.zeros((self.max_history, 2), dtype=np.int16)
+        self._undo_head = 0
+        self._undo_len = 0
+
+        # Action -> (handler, argument), shared by keyboard/mouse input and agents
+        # TODO: Remove handlers for actions your game doesn't use
+        self.action_handlers = {
+            Action.RESET: (self.reset_game, None),
+            Action.ACTION1: (self.move_player, Direction.UP),
+            Action.ACTION2: (self.move_player, Direction.DOWN),
+            Action.ACTION3: (self.move_player, Direction.LEFT),
+            Action.ACTION4: (self.move_player, Direction.RIGHT),
+            Action.ACTION5: (self.handle_interaction, None),   # optional
+            Action.ACTION6: (self.handle_click, None),         # optional, takes (x, y)
+            Action.ACTION7: (self.undo_last_action, None),     # optional
+        }
+
+        # Key -> action for KEYDOWN dispatch, built once
+        self.key_bindings = {
+            pygame.K_r: Action.RESET,
+            pygame.K_w: Action.ACTION1, pygame.K_UP: Action.ACTION1,
+            pygame.K_s: Action.ACTION2, pygame.K_DOWN: Action.ACTION2,
+            pygame.K_a: Action.ACTION3, pygame.K_LEFT: Action.ACTION3,
+            pygame.K_d: Action.ACTION4, pygame.K_RIGHT: Action.ACTION4,
+            pygame.K_SPACE: Action.ACTION5, pygame.K_e: Action.ACTION5,
+            pygame.K_u: Action.ACTION7, pygame.K_z: Action.ACTION7,
+        }
+
+        # What the screen currently shows, so draw() only repaints what changed
+        self._full_redraw = True
+        self._needs_redraw = True  # run() skips drawing entirely while False
+        self._pending_rects: List[pygame.Rect] = []
+        self._drawn_grid = self.grid.copy()
+        self._drawn_player = (self.player_x, self.player_y)
 
         # Setup level
         self.setup_level()
@@ -186,21 +280,17 @@ class GameTemplate:
         - Ensure level is solvable
         """
         # Clear grid
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                self.grid[y][x] = 0
+        self.grid.fill(0)
 
         # Example: Add borders
-        for x in range(self.grid_size):
-            self.grid[0][x] = 1  # Top wall (blue)
-            self.grid[self.grid_size-1][x] = 1  # Bottom wall
-        for y in range(self.grid_size):
-            self.grid[y][0] = 1  # Left wall
-            self.grid[y][self.grid_size-1] = 1  # Right wall
+        self.grid[0, :] = 1  # Top wall (blue)
+        self.grid[-1, :] = 1  # Bottom wall
+        self.grid[:, 0] = 1  # Left wall
+        self.grid[:, -1] = 1  # Right wall
 
         # TODO: Add your game-specific setup here
         # Example: Place goal
-        # self.grid[self.grid_size-2][self.grid_size-2] = 4  # Yellow goal
+        # self.grid[self.grid_size-2, self.grid_size-2] = 4  # Yellow goal
 
         # Reset player
         self.player_x = 1
@@ -210,12 +300,63 @@ class GameTemplate:
         self.won = False
         self.lost = False
         self.flash_timer = 0
+        self._full_redraw = True
+        self._needs_redraw = True
 
         # Clear action history
-        self.action_history.clear()
+        self._undo_len = 0
 
     # ===== HELPER METHODS =====
 
+    def setup_display(self):
+        """Open the window and pre-render every surface draw() uses."""
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+
+        # Have SDL drop mouse motion etc. before it ever reaches the event queue.
+        # TODO: Allow any other event types your game handles.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                                  pygame.WINDOWEXPOSED])
+
+        # Pre-rendered cell tiles (fill + grid line) and their screen positions
+        self.cell_surfaces = [self.make_cell_surface(color) for color in range(len(ARC_PALETTE))]
+        self.cell_positions = [(x * self.cell_size, y * self.cell_size)
+                               for y in range(self.grid_size) for x in range(self.grid_size)]
+        self.background = self.render_background()
+        self.player_surface = self.make_player_surface()
+
+        # Win/loss flash overlays, filled once; draw() only changes their alpha
+        # convert() matches the display format so blits skip pixel conversion
+        self.win_overlay = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self.win_overlay.fill(ARC_COLORS[3])  # Green flash for WIN
+        self.lose_overlay = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self.lose_overlay.fill(ARC_COLORS[2])  # Red flash for LOSE
+
+    def make_cell_surface(self, color: int) -> pygame.Surface:
+        """Render one cell of the given color with its grid line outline."""
+        surface = pygame.Surface((self.cell_size, self.cell_size)).convert()
+        surface.fill(ARC_COLORS[color])
+        # Grid lines (optional - remove if too cluttered)
+        pygame.draw.rect(surface, GRID_LINE_COLOR, surface.get_rect(), 1)
+        return surface
+
+    def make_player_surface(self) -> pygame.Surface:
+        """Render the player sprite once; draw_player() just blits it."""
+        # TODO: Customize player appearance or remove if not needed
+        surface = pygame.Surface((self.cell_size - 4, self.cell_size - 4)).convert()
+        surface.fill(ARC_COLORS[3])  # Green player
+        pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), 2)
+        return surface
+
+    def render_background(self) -> pygame.Surface:
+        """Render the empty (black, outlined) grid once; draw() blits it each frame."""
+        background = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        background.fill(BACKGROUND_COLOR)
+        empty_cell = self.cell_surfaces[0]
+        background.blits([(empty_cell, position) for position in self.cell_positions],
+                         doreturn=False)
+        return background
+
     def is_valid_pos(self, x: int, y: int) -> bool:
         """Check if position is within grid bounds."""
         return 0 <= x < self.grid_size and 0 <= y < self.grid_size
@@ -229,38 +370,51 @@ class GameTemplate:
         if not self.is_valid_pos(x, y):
             return False
         # Example: Wall is color 1 (blue)
-        return self.grid[y][x] != 1
+        return self.grid[y, x] != WALL_COLOR
+
+    # Whole-grid checks run as one NumPy pass - prefer them over looping cells
+
+    def cells_equal(self, color: int) -> np.ndarray:
+        """Boolean (N, N) mask of cells with the given color."""
+        return self.grid == color
+
+    def count_color(self, color: int) -> int:
+        """Number of cells with the given color."""
+        return int(np.count_nonzero(self.grid == color))
+
+    def matches_target(self, target: np.ndarray) -> bool:
+        """Check if the grid equals a target pattern of the same shape."""
+        return np.array_equal(self.grid, target)
 
     def save_state_for_undo(self):
         """
         Save current game state for undo functionality.
         Only needed if implementing ACTION7 (undo).
         """
-        state = {
-            'grid': [row[:] for row in self.grid],  # Deep copy
-            'player_x': self.player_x,
-            'player_y': self.player_y,
-            # TODO: Add any other state variables your game needs to track
-        }
-        self.action_history.append(state)
+        slot = self._undo_head
+        np.copyto(self._undo_grids[slot], self.grid)
+        self._undo_pos[slot] = (self.player_x, self.player_y)
+        # TODO: Track any other state variables your game needs in parallel arrays
 
-        # Limit history size
-        if len(self.action_history) > self.max_history:
-            self.action_history.pop(0)
+        # Oldest snapshot is overwritten once the history is full
+        self._undo_head = (slot + 1) % self.max_history
+        self._undo_len = min(self._undo_len + 1, self.max_history)
 
     def undo_last_action(self):
         """
         Undo the last action (ACTION7).
         Only implement if your game supports undo.
         """
-        if not self.action_history or self.won or self.lost:
+        if not self._undo_len or self.won or self.lost:
             return
 
-        state = self.action_history.pop()
-        self.grid = state['grid']
-        self.player_x = state['player_x']
-        self.player_y = state['player_y']
+        slot = (self._undo_head - 1) % self.max_history
+        self._undo_head = slot
+        self._undo_len -= 1
+        np.copyto(self.grid, self._undo_grids[slot])
+        self.player_x, self.player_y = self._undo_pos[slot].tolist()
         # TODO: Restore any other state variables
+        self._needs_redraw = True
 
     # ===== ACTION HANDLERS =====
 
@@ -282,13 +436,17 @@ class GameTemplate:
         # Save state for undo (optional)
         # self.save_state_for_undo()
 
-        dx, dy = direction.value
+        dx, dy = _DELTAS[direction]
         new_x = self.player_x + dx
         new_y = self.player_y + dy
 
+        # Example: Momentum glide instead of a single step (stops at WALL_COLOR)
+        # new_x, new_y = slide_kernel()(self.grid, self.player_x, self.player_y, dx, dy)
+
         if self.can_move_to(new_x, new_y):
             self.player_x = new_x
             self.player_y = new_y
+            self._needs_redraw = True
 
             # TODO: Add your game logic here
             # Examples:
@@ -320,9 +478,10 @@ class GameTemplate:
 
         # TODO: Implement your interaction logic
         # Example: Toggle cell color at player position
-        # current_color = self.grid[self.player_y][self.player_x]
-        # self.grid[self.player_y][self.player_x] = (current_color + 1) % 10
+        # current_color = self.grid[self.player_y, self.player_x]
+        # self.grid[self.player_y, self.player_x] = (current_color + 1) % 10
 
+        self._needs_redraw = True
         self.check_game_state()
 
     def handle_click(self, grid_x: int, grid_y: int):
@@ -349,8 +508,9 @@ class GameTemplate:
 
         # TODO: Implement your click logic
         # Example: Change clicked cell color
-        # self.grid[grid_y][grid_x] = 4  # Yellow
+        # self.grid[grid_y, grid_x] = 4  # Yellow
 
+        self._needs_redraw = True
         self.check_game_state()
 
     def check_game_state(self):
@@ -371,6 +531,10 @@ class GameTemplate:
         - Lose: Touch hazard
         - Lose: Run out of moves/energy
         - Lose: Exceed time limit
+
+        Grid-wide conditions should use the vectorized helpers, e.g.
+        self.count_color(4) == 0 (all items collected), self.matches_target(target),
+        or self.cells_equal(2).any() (a hazard is still on the board).
         """
 
         # Example win condition: Reach bottom-right corner
@@ -379,7 +543,7 @@ class GameTemplate:
             self.flash_timer = pygame.time.get_ticks()
 
         # Example loss condition: Touch red cell
-        if self.grid[self.player_y][self.player_x] == 2:  # Red = hazard
+        if self.grid[self.player_y, self.player_x] == 2:  # Red = hazard
             self.lost = True
             self.flash_timer = pygame.time.get_ticks()
 
@@ -387,10 +551,12 @@ class GameTemplate:
         """RESET: Restart the game."""
         self.setup_level()
 
-    def update(self, dt: float):
+    def update(self, dt: float, current_time: int):
         """
         Update game state (called every frame).
 
+        current_time is pygame.time.get_ticks(), read once per frame by run().
+
         TODO: Add your update logic here if needed.
 
         Examples:
@@ -399,69 +565,101 @@ class GameTemplate:
         - Progress timers
         - Apply physics
         - Check automatic state changes
-        """
-        current_time = pygame.time.get_ticks()
 
+        Set self._needs_redraw = True whenever this changes what is on screen;
+        run() does not draw frames where nothing changed.
+        """
         # Handle win/loss timing - DO NOT MODIFY
         if (self.won or self.lost) and self.flash_timer > 0:
+            self._needs_redraw = True  # Flash is animating
             if current_time - self.flash_timer > self.flash_duration:
                 self.reset_game()
 
         # TODO: Add your update logic here
 
-    def draw(self):
+    def draw(self, current_time: int):
         """
         Draw the game.
 
         NO TEXT ALLOWED - Pure visual communication only.
 
-        TODO: Customize rendering for your game.
+        Only cells whose color changed since the last frame, plus the cells the
+        player left and entered, are redrawn; run() pushes just those rects to
+        the display. Level setup and the win/loss flash redraw the whole screen.
         """
-        self.screen.fill(ARC_COLORS[0])  # Black background
+        flashing = ((self.won or self.lost) and self.flash_timer > 0
+                    and current_time - self.flash_timer < self.flash_duration)
 
-        # Draw grid cells
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                rect = pygame.Rect(x * self.cell_size, y * self.cell_size,
-                                 self.cell_size, self.cell_size)
+        if self._full_redraw or flashing:
+            self.draw_full(current_time)
+            self._pending_rects = [self.screen.get_rect()]
+            # Redraw fully once more after the flash so the overlay is cleared
+            self._full_redraw = flashing
+        else:
+            self._pending_rects = self.draw_changed_cells()
 
-                cell_value = self.grid[y][x]
-                if cell_value > 0:
-                    pygame.draw.rect(self.screen, ARC_COLORS[cell_value], rect)
+        np.copyto(self._drawn_grid, self.grid)
+        self._drawn_player = (self.player_x, self.player_y)
 
-                # Grid lines (optional - remove if too cluttered)
-                pygame.draw.rect(self.screen, ARC_COLORS[5], rect, 1)
+    def draw_full(self, current_time: int):
+        """
+        Redraw the whole screen.
 
-        # Draw player (if your game has one)
-        # TODO: Customize player appearance or remove if not needed
-        player_rect = pygame.Rect(self.player_x * self.cell_size + 2,
-                                self.player_y * self.cell_size + 2,
-                                self.cell_size - 4, self.cell_size - 4)
-        pygame.draw.rect(self.screen, ARC_COLORS[3], player_rect)  # Green player
-        pygame.draw.rect(self.screen, (255, 255, 255), player_rect, 2)
+        TODO: Customize rendering for your game. Anything drawn here that is not
+        a grid cell or the player should set self._full_redraw = True when it
+        changes, otherwise draw_changed_cells() will not repaint it.
+        """
+        self.screen.blit(self.background, (0, 0))  # Black background + grid lines
+
+        # Draw colored cells: one pre-rendered tile each, in a single batched call
+        cells = self.grid.ravel()
+        filled = np.flatnonzero(cells)
+        cell_surfaces = self.cell_surfaces
+        positions = self.cell_positions
+        self.screen.blits([(cell_surfaces[value], positions[i]) for value, i
+                           in zip(cells[filled].tolist(), filled.tolist())],
+                          doreturn=False)
+
+        self.draw_player()
 
         # NO TEXT - EVER - This is a mandatory ARC-AGI-3 constraint
 
         # Win/Loss effects - MANDATORY: User must be informed when they win or lose
         # GREEN FLASH = WIN, RED FLASH = LOSE (DO NOT CHANGE THESE COLORS)
-        current_time = pygame.time.get_ticks()
-        if self.won and self.flash_timer > 0:
+        if (self.won or self.lost) and self.flash_timer > 0:
             elapsed = current_time - self.flash_timer
             if elapsed < self.flash_duration:
-                alpha = int(80 * (1 - elapsed / self.flash_duration))
-                overlay = pygame.Surface((self.screen_width, self.screen_height))
-                overlay.set_alpha(alpha)
-                overlay.fill(ARC_COLORS[3])  # Green flash for WIN
+                overlay = self.win_overlay if self.won else self.lose_overlay
+                overlay.set_alpha(int(80 * (1 - elapsed / self.flash_duration)))
                 self.screen.blit(overlay, (0, 0))
 
-        elif self.lost and self.flash_timer > 0:
-            elapsed = current_time - self.flash_timer
-            if elapsed < self.flash_duration:
-                alpha = int(80 * (1 - elapsed / self.flash_duration))
-                overlay = pygame.Surface((self.screen_width, self.screen_height))
-                overlay.set_alpha(alpha)
-                overlay.fill(ARC_COLORS[2])  # Red flash for LOSE
-                self.screen.blit(overlay, (0, 0))
+    def draw_changed_cells(self) -> List[pygame.Rect]:
+        """Redraw cells that differ from the last frame and return their rects."""
+        grid = self.grid
+        player_x = self.player_x
+        player_y = self.player_y
+        changed = grid != self._drawn_grid
+        if self._drawn_player != (player_x, player_y):
+            old_x, old_y = self._drawn_player
+            changed[old_y, old_x] = True
+            changed[player_y, player_x] = True
+
+        cells = np.flatnonzero(changed)
+        if not cells.size:
+            return []
+
+        # One batched blit; blits() hands back the rect each tile covered
+        cell_surfaces = self.cell_surfaces
+        positions = self.cell_positions
+        rects = self.screen.blits([(cell_surfaces[value], positions[i]) for value, i
+                                   in zip(grid.ravel()[cells].tolist(), cells.tolist())])
+        self.draw_player()
+        return rects
+
+    def draw_player(self):
+        """Draw the player (if your game has one)."""
+        self.screen.blit(self.player_surface, (self.player_x * self.cell_size + 2,
+                                               self.player_y * self.cell_size + 2))
 
     def handle_events(self):
         """
@@ -479,32 +677,21 @@ class GameTemplate:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # Window was uncovered or restored: repaint everything
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_redraw = True
+                self._needs_redraw = True
+
             elif event.type == pygame.KEYDOWN:
                 # ESC: Quit (development only - remove for submission)
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
 
-                # RESET: Restart level
-                elif event.key == pygame.K_r:
-                    self.reset_game()
-
-                # ACTION1-4: Movement (WASD or arrows)
-                elif event.key in [pygame.K_w, pygame.K_UP]:
-                    self.move_player(Direction.UP)
-                elif event.key in [pygame.K_s, pygame.K_DOWN]:
-                    self.move_player(Direction.DOWN)
-                elif event.key in [pygame.K_a, pygame.K_LEFT]:
-                    self.move_player(Direction.LEFT)
-                elif event.key in [pygame.K_d, pygame.K_RIGHT]:
-                    self.move_player(Direction.RIGHT)
-
-                # ACTION5: Interaction (SPACE or E) - optional
-                elif event.key in [pygame.K_SPACE, pygame.K_e]:
-                    self.handle_interaction()
-
-                # ACTION7: Undo (U or Z) - optional
-                elif event.key in [pygame.K_u, pygame.K_z]:
-                    self.undo_last_action()
+                # RESET and ACTION1-5, 7: see self.key_bindings
+                else:
+                    action = self.key_bindings.get(event.key)
+                    if action:
+                        self._apply_action(action)
 
             # ACTION6: Click (mouse) - optional
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -512,21 +699,53 @@ class GameTemplate:
                     mouse_x, mouse_y = event.pos
                     grid_x = mouse_x // self.cell_size
                     grid_y = mouse_y // self.cell_size
-                    self.handle_click(grid_x, grid_y)
+                    self._apply_action(Action.ACTION6, grid_x, grid_y)
+
+    def _apply_action(self, action: Action, *args):
+        """Run one ARC-AGI-3 action; ACTION6 takes (grid_x, grid_y)."""
+        handler, arg = self.action_handlers[action]
+        if arg is None:
+            handler(*args)
+        else:
+            handler(arg)
 
     def run(self):
         """Main game loop - DO NOT MODIFY."""
+        # Compile the movement kernels while the window is already up and usable
+        threading.Thread(target=warm_up_kernels, daemon=True).start()
+
         while self.running:
             dt = self.clock.tick(self.fps)
 
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            now = pygame.time.get_ticks()
+            self.update(dt, now)
 
-            pygame.display.flip()
+            # Turn-based games sit idle between inputs; only draw when needed
+            if self._needs_redraw:
+                self.draw(now)
+                pygame.display.update(self._pending_rects)
+                self._needs_redraw = False
 
         pygame.quit()
 
+    def run_headless(self, actions):
+        """
+        Step the game for an agent without events, clock or rendering.
+
+        Construct the game with headless=True. Each item in actions is an
+        Action, or a tuple (Action.ACTION6, x, y) for clicks. After each one,
+        yields (grid, player_x, player_y, won, lost); grid is the live array,
+        so copy it to keep a frame. The win/loss flash never auto-resets here -
+        send Action.RESET to start over.
+        """
+        for action in actions:
+            if isinstance(action, tuple):
+                self._apply_action(*action)
+            else:
+                self._apply_action(action)
+            yield self.grid, self.player_x, self.player_y, self.won, self.lost
+
 # ===== ENTRY POINT =====
 
 if __name__ == "__main__":
@@ -29,15 +29,34 @@ Controls:
 - ESC: Quit
 """
 
-import sys
-import os
-from typing import List, Tuple, Optional
+from typing import List, Optional
 from enum import Enum
+import numpy as np
 import pygame
 
-# Add tools to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
-from arc_agi_editor.editor.utils import ARC_COLORS
+# ARC-AGI-3 16-color palette, same values as arc_agi_editor.editor.utils.ARC_COLORS.
+# Kept inline so starting the game doesn't import the editor package.
+ARC_COLORS = {
+    # Original 10 ARC colors (0-9)
+    0: (0, 0, 0),        # Black - Background/Empty
+    1: (0, 116, 217),    # Blue
+    2: (255, 65, 54),    # Red
+    3: (46, 204, 64),    # Green
+    4: (255, 220, 0),    # Yellow
+    5: (170, 170, 170),  # Gray
+    6: (240, 18, 190),   # Magenta
+    7: (255, 133, 27),   # Orange
+    8: (127, 219, 255),  # Sky Blue
+    9: (135, 12, 37),    # Maroon
+
+    # Extended 6 colors for ARC-AGI-3 (10-15)
+    10: (87, 117, 144),   # Slate Gray
+    11: (255, 195, 160),  # Peach
+    12: (180, 255, 180),  # Light Green
+    13: (255, 255, 200),  # Cream
+    14: (220, 160, 220),  # Lavender
+    15: (160, 220, 255)   # Light Blue
+}
 
 class Direction(Enum):
     UP = (0, -1)
@@ -45,6 +64,9 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+# (dx, dy) per direction, so movement skips the Enum .value descriptor
+_DELTAS = {direction: direction.value for direction in Direction}
+
 class MirrorPainter:
     """Mirror Painter puzzle game."""
 
@@ -69,9 +91,17 @@ class MirrorPainter:
         self.running = True
         self.fps = 10
 
-        # Grids
-        self.target_grid = [[0]*self.grid_size for _ in range(self.grid_size)]
-        self.player_grid = [[0]*self.grid_size for _ in range(self.grid_size)]
+        # Held direction keys keep moving the cursor, one step per move_repeat_ms
+        self.held_keys = (((pygame.K_w, pygame.K_UP), Direction.UP),
+                          ((pygame.K_s, pygame.K_DOWN), Direction.DOWN),
+                          ((pygame.K_a, pygame.K_LEFT), Direction.LEFT),
+                          ((pygame.K_d, pygame.K_RIGHT), Direction.RIGHT))
+        self.move_repeat_ms = 100
+        self.last_move_time = 0
+
+        # Grids (uint8 color arrays, indexed as grid[y, x])
+        self.target_grid = np.zeros((self.grid_size, self.grid_size), dtype=np.uint8)
+        self.player_grid = np.zeros((self.grid_size, self.grid_size), dtype=np.uint8)
 
         # Target display area (top 3 rows reserved for showing target pattern)
         self.target_display_rows = 3
@@ -92,8 +122,10 @@ class MirrorPainter:
         self.level = 0
         self.levels = []
 
-        # Undo system
-        self.paint_history: List[Tuple[int, int, int]] = []  # (x, y, old_color)
+        # Undo system: rows of (x, y, old_color); every paint is a move and the
+        # level ends at max_moves, so the stack can never overflow
+        self.paint_history = np.empty((self.max_moves, 3), dtype=np.int16)
+        self.paint_count = 0
 
         # Win/loss state
         self.won = False
@@ -101,54 +133,66 @@ class MirrorPainter:
         self.flash_timer = 0
         self.flash_duration = 1000
 
+        # Set whenever something on screen changes; run() skips clean frames.
+        # update_rects limits the display update to those areas (None = whole screen)
+        self.dirty = True
+        self.update_rects: Optional[List[pygame.Rect]] = None
+
+        # Screen rect of every cell, as cell_rects[y][x]; they never move
+        self.cell_rects = [[pygame.Rect(x * self.cell_size, y * self.cell_size,
+                                        self.cell_size, self.cell_size)
+                            for x in range(self.grid_size)] for y in range(self.grid_size)]
+        # One solid cell-sized tile per color, so painted cells go out in one blits() call
+        self.cell_tiles = []
+        for color in range(len(ARC_COLORS)):
+            tile = pygame.Surface((self.cell_size, self.cell_size)).convert()
+            tile.fill(ARC_COLORS[color])
+            self.cell_tiles.append(tile)
+        self.gridlines = self.render_gridlines()
+
+        # Win/loss flash overlays, filled once; draw() only changes their alpha
+        self.win_overlay = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self.win_overlay.fill(ARC_COLORS[3])  # Green flash
+        self.lose_overlay = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self.lose_overlay.fill(ARC_COLORS[2])  # Red flash
+
         self.setup_levels()
         self.load_level(0)
 
     def setup_levels(self):
         """Create all target patterns."""
 
+        size = self.grid_size
+        start = self.playable_row_start
+        rows = np.arange(start, size)
+        cols = np.arange(size)
+        yy, xx = np.ogrid[:size, :size]
+
         # Level 1: Simple horizontal stripes
-        level1 = [[0]*self.grid_size for _ in range(self.grid_size)]
-        for y in range(self.playable_row_start, self.grid_size):
-            if y % 3 == 0:
-                for x in range(self.grid_size):
-                    level1[y][x] = 1  # Blue stripe
-            elif y % 3 == 1:
-                for x in range(self.grid_size):
-                    level1[y][x] = 2  # Red stripe
+        level1 = np.zeros((size, size), dtype=np.uint8)
+        level1[rows[rows % 3 == 0]] = 1  # Blue stripe
+        level1[rows[rows % 3 == 1]] = 2  # Red stripe
 
         # Level 2: Vertical stripes (symmetric)
-        level2 = [[0]*self.grid_size for _ in range(self.grid_size)]
-        for y in range(self.playable_row_start, self.grid_size):
-            for x in range(self.grid_size):
-                if x % 3 == 0:
-                    level2[y][x] = 3  # Green
-                elif x % 3 == 1:
-                    level2[y][x] = 4  # Yellow
+        level2 = np.zeros((size, size), dtype=np.uint8)
+        level2[start:, cols % 3 == 0] = 3  # Green
+        level2[start:, cols % 3 == 1] = 4  # Yellow
 
         # Level 3: Border frame
-        level3 = [[0]*self.grid_size for _ in range(self.grid_size)]
-        for y in range(self.playable_row_start, self.grid_size):
-            for x in range(self.grid_size):
-                if y == self.playable_row_start or y == self.grid_size - 1 or x == 0 or x == self.grid_size - 1:
-                    level3[y][x] = 6  # Magenta frame
+        level3 = np.zeros((size, size), dtype=np.uint8)
+        level3[start, :] = 6  # Magenta frame
+        level3[-1, :] = 6
+        level3[start:, 0] = 6
+        level3[start:, -1] = 6
 
         # Level 4: Checkerboard pattern
-        level4 = [[0]*self.grid_size for _ in range(self.grid_size)]
-        for y in range(self.playable_row_start, self.grid_size):
-            for x in range(self.grid_size):
-                if (x + y) % 2 == 0:
-                    level4[y][x] = 1  # Blue
-                else:
-                    level4[y][x] = 7  # Orange
+        level4 = np.zeros((size, size), dtype=np.uint8)
+        level4[start:] = np.where((xx + yy) % 2 == 0, 1, 7)[start:]  # Blue / Orange
 
         # Level 5: Cross pattern
-        level5 = [[0]*self.grid_size for _ in range(self.grid_size)]
-        mid = self.grid_size // 2
-        for y in range(self.playable_row_start, self.grid_size):
-            for x in range(self.grid_size):
-                if x == mid or y == mid:
-                    level5[y][x] = 2  # Red cross
+        level5 = np.zeros((size, size), dtype=np.uint8)
+        mid = size // 2
+        level5[start:] = np.where((xx == mid) | (yy == mid), 2, 0)[start:]  # Red cross
 
         self.levels = [level1, level2, level3, level4, level5]
 
@@ -158,10 +202,22 @@ class MirrorPainter:
             level_num = 0  # Loop back to first level
 
         self.level = level_num
-        self.target_grid = [row[:] for row in self.levels[level_num]]  # Deep copy
+        self.target_grid = self.levels[level_num].copy()
+
+        # The player grid is always mirrored, so it can only ever match a mirrored
+        # target, and then comparing the unmirrored (left) columns is enough
+        start = self.playable_row_start
+        half = self.grid_size // 2
+        self.target_symmetric = np.array_equal(self.target_grid[start:, self.grid_size - half:],
+                                               self.target_grid[start:, half - 1::-1])
+        self.target_left = self.target_grid[start:, :self.grid_size - half]
+        # Non-black cells the player's left side needs; set_mirrored keeps the
+        # player's count current so most win checks end without comparing
+        self.target_cells_needed = int(np.count_nonzero(self.target_left))
+        self.player_cells_painted = 0
 
         # Clear player grid
-        self.player_grid = [[0]*self.grid_size for _ in range(self.grid_size)]
+        self.player_grid.fill(0)
 
         # Reset game state
         self.cursor_x = 2
@@ -170,24 +226,102 @@ class MirrorPainter:
         self.won = False
         self.lost = False
         self.flash_timer = 0
-        self.paint_history.clear()
+        self.paint_count = 0
         self.current_color_index = 0
         self.current_color = self.colors_available[self.current_color_index]
 
+        self.target_surface = self.render_target_panel()
+        self.mark_dirty()
+
+    def render_target_panel(self) -> pygame.Surface:
+        """Render the scaled-down target pattern shown above the playable area."""
+        panel = pygame.Surface((self.screen_width, self.target_display_rows * self.cell_size)).convert()
+        panel.fill(ARC_COLORS[0])
+
+        target_scale = 0.6
+        target_cell_size = int(self.cell_size * target_scale)
+        target_offset_x = (self.screen_width - self.grid_size * target_cell_size) // 2
+
+        for y in range(self.target_display_rows):
+            for x in range(self.grid_size):
+                # Draw target pattern (scaled down)
+                rect = pygame.Rect(
+                    target_offset_x + x * target_cell_size,
+                    y * target_cell_size,
+                    target_cell_size,
+                    target_cell_size
+                )
+
+                # Map full grid to target display area
+                source_y = self.playable_row_start + int((y / self.target_display_rows) * (self.grid_size - self.playable_row_start))
+                if source_y < self.grid_size:
+                    cell_color = int(self.target_grid[source_y, x])
+                    if cell_color > 0:
+                        pygame.draw.rect(panel, ARC_COLORS[cell_color], rect)
+                    pygame.draw.rect(panel, ARC_COLORS[5], rect, 1)
+
+        return panel
+
+    def render_gridlines(self) -> pygame.Surface:
+        """Build the playable-area outline and mirror line overlay once; it only depends on the layout."""
+        height = (self.grid_size - self.playable_row_start) * self.cell_size
+        overlay = pygame.Surface((self.screen_width, height))
+        overlay.fill((0, 0, 0))
+        for y in range(self.grid_size - self.playable_row_start):
+            for x in range(self.grid_size):
+                rect = pygame.Rect(x * self.cell_size, y * self.cell_size,
+                                 self.cell_size, self.cell_size)
+                pygame.draw.rect(overlay, ARC_COLORS[5], rect, 1)
+
+        # Vertical mirror line (bright white)
+        mirror_x = self.mirror_line * self.cell_size
+        pygame.draw.line(overlay, (255, 255, 255), (mirror_x, 0), (mirror_x, height), 3)
+
+        overlay.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return overlay
+
+    def mark_dirty(self, *rects: pygame.Rect):
+        """Request a redraw; with rects, only those areas need to reach the display."""
+        if not rects:
+            self.update_rects = None
+        elif not self.dirty:
+            self.update_rects = list(rects)
+        elif self.update_rects is not None:
+            self.update_rects.extend(rects)
+        self.dirty = True
+
+    def cell_rect(self, x: int, y: int) -> pygame.Rect:
+        """Screen rect of a playable-grid cell."""
+        return pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+
     def move_cursor(self, direction: Direction):
         """Move cursor (restricted to playable area)."""
         if self.won or self.lost:
             return
 
-        dx, dy = direction.value
+        self.last_move_time = pygame.time.get_ticks()
+
+        dx, dy = _DELTAS[direction]
         new_x = self.cursor_x + dx
         new_y = self.cursor_y + dy
 
         # Keep cursor in playable area
         if 0 <= new_x < self.grid_size and self.playable_row_start <= new_y < self.grid_size:
+            self.mark_dirty(self.cell_rect(self.cursor_x, self.cursor_y),
+                            self.cell_rect(new_x, new_y))
             self.cursor_x = new_x
             self.cursor_y = new_y
 
+    def poll_held_keys(self):
+        """Repeat cursor moves while a direction key stays held down."""
+        if pygame.time.get_ticks() - self.last_move_time < self.move_repeat_ms:
+            return
+        pressed = pygame.key.get_pressed()
+        for (key, alt_key), direction in self.held_keys:
+            if pressed[key] or pressed[alt_key]:
+                self.move_cursor(direction)
+                return
+
     def cycle_color(self, direction: int):
         """Select next/previous color."""
         if self.won or self.lost:
@@ -195,6 +329,7 @@ class MirrorPainter:
 
         self.current_color_index = (self.current_color_index + direction) % len(self.colors_available)
         self.current_color = self.colors_available[self.current_color_index]
+        self.mark_dirty(self.cell_rect(self.cursor_x, self.cursor_y))  # Cursor shows the color
 
     def paint_cell(self):
         """Paint current cell and update mirror."""
@@ -206,63 +341,59 @@ class MirrorPainter:
             return
 
         # Save for undo
-        old_color = self.player_grid[self.cursor_y][self.cursor_x]
+        old_color = int(self.player_grid[self.cursor_y, self.cursor_x])
 
         # Don't count as move if painting same color
         if old_color == self.current_color:
             return
 
-        self.paint_history.append((self.cursor_x, self.cursor_y, old_color))
-
-        # Paint the cell
-        self.player_grid[self.cursor_y][self.cursor_x] = self.current_color
+        self.paint_history[self.paint_count] = (self.cursor_x, self.cursor_y, old_color)
+        self.paint_count += 1
 
-        # Update mirror
-        self.update_mirror()
+        # Paint the cell and its mirror image
+        self.set_mirrored(self.cursor_x, self.cursor_y, self.current_color)
 
         # Increment move counter
         self.moves_used += 1
+        self.mark_dirty()
 
         # Check win/loss
         self.check_game_state()
 
-    def update_mirror(self):
-        """Generate mirrored right side from left side."""
-        mirror_x = self.grid_size - 1
-
-        for y in range(self.grid_size):
-            for x in range(self.grid_size // 2):
-                # Mirror left to right
-                mirrored_x = mirror_x - x
-                self.player_grid[y][mirrored_x] = self.player_grid[y][x]
+    def set_mirrored(self, x: int, y: int, color: int):
+        """Set a left-side cell and its mirrored cell on the right side."""
+        half = self.grid_size // 2
+        if x < self.grid_size - half:
+            self.player_cells_painted += (color != 0) - (int(self.player_grid[y, x]) != 0)
+        if x < half:
+            self.player_grid[y, x] = color
+            self.player_grid[y, self.grid_size - 1 - x] = color
+        elif x < self.grid_size - half:
+            self.player_grid[y, x] = color  # Middle column of an odd grid has no mirror
+        # Right-side cells always show the mirror of the left side, so painting
+        # them directly leaves the grid unchanged
 
     def undo_last_paint(self):
         """Undo last paint action."""
-        if not self.paint_history or self.won or self.lost:
+        if not self.paint_count or self.won or self.lost:
             return
 
-        x, y, old_color = self.paint_history.pop()
-        self.player_grid[y][x] = old_color
-
-        # Update mirror
-        self.update_mirror()
+        self.paint_count -= 1
+        x, y, old_color = self.paint_history[self.paint_count].tolist()
+        self.set_mirrored(x, y, old_color)
 
         # Decrement move counter
         self.moves_used = max(0, self.moves_used - 1)
+        self.mark_dirty()
 
     def check_game_state(self):
         """Check for win/loss conditions."""
         # Check if player grid matches target grid (only in playable area)
-        matches = True
-        for y in range(self.playable_row_start, self.grid_size):
-            for x in range(self.grid_size):
-                if self.player_grid[y][x] != self.target_grid[y][x]:
-                    matches = False
-                    break
-            if not matches:
-                break
-
-        if matches:
+        # (the right half always mirrors the left, see load_level)
+        start = self.playable_row_start
+        left = self.player_grid[start:, :self.target_left.shape[1]]
+        if (self.target_symmetric and self.player_cells_painted == self.target_cells_needed
+                and np.array_equal(left, self.target_left)):
             self.won = True
             self.flash_timer = pygame.time.get_ticks()
             return
@@ -286,6 +417,7 @@ class MirrorPainter:
 
         # Handle win/loss timing
         if (self.won or self.lost) and self.flash_timer > 0:
+            self.mark_dirty()  # Flash is fading
             if current_time - self.flash_timer > self.flash_duration:
                 if self.won:
                     self.next_level()
@@ -296,52 +428,26 @@ class MirrorPainter:
         """Draw the game."""
         self.screen.fill(ARC_COLORS[0])  # Black background
 
-        # Draw target pattern in top 3 rows (scaled down)
-        target_scale = 0.6
-        target_cell_size = int(self.cell_size * target_scale)
-        target_offset_x = (self.screen_width - self.grid_size * target_cell_size) // 2
-
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                if y < self.target_display_rows:
-                    # Draw target pattern (scaled down)
-                    rect = pygame.Rect(
-                        target_offset_x + x * target_cell_size,
-                        y * target_cell_size,
-                        target_cell_size,
-                        target_cell_size
-                    )
-
-                    # Map full grid to target display area
-                    source_y = self.playable_row_start + int((y / self.target_display_rows) * (self.grid_size - self.playable_row_start))
-                    if source_y < self.grid_size:
-                        cell_color = self.target_grid[source_y][x]
-                        if cell_color > 0:
-                            pygame.draw.rect(self.screen, ARC_COLORS[cell_color], rect)
-                        pygame.draw.rect(self.screen, ARC_COLORS[5], rect, 1)
+        # Target pattern in top 3 rows (pre-rendered when the level loads)
+        self.screen.blit(self.target_surface, (0, 0))
 
         # Draw separator line between target and playable area
         separator_y = self.target_display_rows * self.cell_size
         pygame.draw.line(self.screen, ARC_COLORS[5],
                         (0, separator_y), (self.screen_width, separator_y), 3)
 
-        # Draw playable grid
-        for y in range(self.playable_row_start, self.grid_size):
-            for x in range(self.grid_size):
-                rect = pygame.Rect(x * self.cell_size, y * self.cell_size,
-                                 self.cell_size, self.cell_size)
-
-                cell_color = self.player_grid[y][x]
-                if cell_color > 0:
-                    pygame.draw.rect(self.screen, ARC_COLORS[cell_color], rect)
-
-                # Grid lines
-                pygame.draw.rect(self.screen, ARC_COLORS[5], rect, 1)
+        # Draw playable grid (painted cells only)
+        start = self.playable_row_start
+        playable = self.player_grid[start:]
+        ys, xs = np.nonzero(playable)
+        cell_rects = self.cell_rects
+        cell_tiles = self.cell_tiles
+        self.screen.blits([(cell_tiles[cell_color], cell_rects[y][x]) for y, x, cell_color
+                           in zip((ys + start).tolist(), xs.tolist(), playable[ys, xs].tolist())],
+                          doreturn=False)
 
-        # Draw vertical mirror line (bright white)
-        mirror_x = self.mirror_line * self.cell_size
-        pygame.draw.line(self.screen, (255, 255, 255),
-                        (mirror_x, separator_y), (mirror_x, self.screen_height), 3)
+        # Grid lines and vertical mirror line
+        self.screen.blit(self.gridlines, (0, separator_y))
 
         # Draw cursor (white border)
         if self.playable_row_start <= self.cursor_y < self.grid_size:
@@ -376,72 +482,70 @@ class MirrorPainter:
 
         # Win/Loss effects
         current_time = pygame.time.get_ticks()
-        if self.won and self.flash_timer > 0:
-            elapsed = current_time - self.flash_timer
-            if elapsed < self.flash_duration:
-                alpha = int(100 * (1 - elapsed / self.flash_duration))
-                overlay = pygame.Surface((self.screen_width, self.screen_height))
-                overlay.set_alpha(alpha)
-                overlay.fill(ARC_COLORS[3])  # Green flash
-                self.screen.blit(overlay, (0, 0))
-
-        elif self.lost and self.flash_timer > 0:
+        if (self.won or self.lost) and self.flash_timer > 0:
             elapsed = current_time - self.flash_timer
             if elapsed < self.flash_duration:
-                alpha = int(100 * (1 - elapsed / self.flash_duration))
-                overlay = pygame.Surface((self.screen_width, self.screen_height))
-                overlay.set_alpha(alpha)
-                overlay.fill(ARC_COLORS[2])  # Red flash
+                overlay = self.win_overlay if self.won else self.lose_overlay
+                overlay.set_alpha(int(100 * (1 - elapsed / self.flash_duration)))
                 self.screen.blit(overlay, (0, 0))
 
     def handle_events(self):
         """Handle input events."""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+            self.handle_event(event)
 
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_r:
-                    self.reset_level()
+    def handle_event(self, event: pygame.event.Event):
+        """Handle a single input event."""
+        if event.type == pygame.QUIT:
+            self.running = False
 
-                # Cursor movement
-                elif event.key in [pygame.K_w, pygame.K_UP]:
-                    self.move_cursor(Direction.UP)
-                elif event.key in [pygame.K_s, pygame.K_DOWN]:
-                    self.move_cursor(Direction.DOWN)
-                elif event.key in [pygame.K_a, pygame.K_LEFT]:
-                    self.move_cursor(Direction.LEFT)
-                elif event.key in [pygame.K_d, pygame.K_RIGHT]:
-                    self.move_cursor(Direction.RIGHT)
-
-                # Paint action
-                elif event.key == pygame.K_SPACE:
-                    self.paint_cell()
+        # Window was uncovered or restored: repaint everything
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.mark_dirty()
 
-                # Color selection
-                elif event.key == pygame.K_q:
-                    self.cycle_color(-1)
-                elif event.key == pygame.K_e:
-                    self.cycle_color(1)
-
-                # Undo
-                elif event.key in [pygame.K_u, pygame.K_z]:
-                    self.undo_last_paint()
-
-            # Click to paint
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    mouse_x, mouse_y = event.pos
-                    grid_x = mouse_x // self.cell_size
-                    grid_y = mouse_y // self.cell_size
-
-                    if (0 <= grid_x < self.grid_size and
-                        self.playable_row_start <= grid_y < self.grid_size):
-                        self.cursor_x = grid_x
-                        self.cursor_y = grid_y
-                        self.paint_cell()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif event.key == pygame.K_r:
+                self.reset_level()
+
+            # Cursor movement
+            elif event.key in [pygame.K_w, pygame.K_UP]:
+                self.move_cursor(Direction.UP)
+            elif event.key in [pygame.K_s, pygame.K_DOWN]:
+                self.move_cursor(Direction.DOWN)
+            elif event.key in [pygame.K_a, pygame.K_LEFT]:
+                self.move_cursor(Direction.LEFT)
+            elif event.key in [pygame.K_d, pygame.K_RIGHT]:
+                self.move_cursor(Direction.RIGHT)
+
+            # Paint action
+            elif event.key == pygame.K_SPACE:
+                self.paint_cell()
+
+            # Color selection
+            elif event.key == pygame.K_q:
+                self.cycle_color(-1)
+            elif event.key == pygame.K_e:
+                self.cycle_color(1)
+
+            # Undo
+            elif event.key in [pygame.K_u, pygame.K_z]:
+                self.undo_last_paint()
+
+        # Click to paint
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                mouse_x, mouse_y = event.pos
+                grid_x = mouse_x // self.cell_size
+                grid_y = mouse_y // self.cell_size
+
+                if (0 <= grid_x < self.grid_size and
+                    self.playable_row_start <= grid_y < self.grid_size):
+                    self.mark_dirty()
+                    self.cursor_x = grid_x
+                    self.cursor_y = grid_y
+                    self.paint_cell()
 
     def run(self):
         """Main game loop."""
@@ -449,13 +553,30 @@ class MirrorPainter:
             dt = self.clock.tick(self.fps)
 
             self.handle_events()
+            self.poll_held_keys()
             self.update(dt)
-            self.draw()
 
-            pygame.display.flip()
+            if self.dirty:
+                self.draw()
+                if self.update_rects is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(self.update_rects)
+                self.dirty = False
+
+            # Nothing to redraw, animate or repeat: sleep until the next event
+            if self.running and self.is_idle():
+                self.handle_event(pygame.event.wait())
 
         pygame.quit()
 
+    def is_idle(self) -> bool:
+        """Check if the game can block on input without missing anything."""
+        if self.dirty or self.won or self.lost:
+            return False
+        pressed = pygame.key.get_pressed()
+        return not any(pressed[key] or pressed[alt_key] for (key, alt_key), _ in self.held_keys)
+
 if __name__ == "__main__":
     game = MirrorPainter()
     game.run()
@@ -30,6 +30,8 @@ from typing import List, Tuple, Optional, Dict, Set
 from enum import Enum
 import copy
 
+import numpy as np
+
 # Auto-detect and use virtual environment for pygame
 try:
     import pygame
@@ -99,14 +101,16 @@ class PatternThief:
         self.completed_levels = {1, 2}  # Mark levels 1-2 as completed
 
         # Grid (0 = empty)
-        self.grid = [[0 for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        self.grid = np.zeros((self.grid_size, self.grid_size), dtype=np.uint8)
 
         # Player position
         self.player_x = 0
         self.player_y = 0
 
-        # Target pattern
-        self.target_pattern = []
+        # Target pattern, and the landing zone cells it is checked against
+        self.target_pattern = np.zeros((0, 0), dtype=np.uint8)
+        self.target_pattern_arr = self.target_pattern
+        self.landing_slice = (slice(0, 0), slice(0, 0))
 
         # Level-specific state
         self.landing_zone_x = 0
@@ -156,15 +160,13 @@ class PatternThief:
     def setup_level_1(self):
         """Level 1: Basic Sokoban push."""
         # Clear grid
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                self.grid[y][x] = 0
+        self.grid.fill(0)
 
         # Target pattern (2x2)
-        self.target_pattern = [
+        self.target_pattern = np.array([
             [2, 4],  # Red, Yellow
             [1, 3]   # Blue, Green
-        ]
+        ], dtype=np.uint8)
 
         # Display positions
         self.target_display_x = 2
@@ -173,41 +175,26 @@ class PatternThief:
         self.landing_zone_y = 16
 
         # Add border walls
-        for x in range(self.grid_size):
-            self.grid[0][x] = 5
-            self.grid[self.grid_size-1][x] = 5
-        for y in range(self.grid_size):
-            self.grid[y][0] = 5
-            self.grid[y][self.grid_size-1] = 5
+        self.grid[0, :] = self.grid[-1, :] = self.grid[:, 0] = self.grid[:, -1] = 5
 
         # Landing zone background
-        for dy in range(2):
-            for dx in range(2):
-                x = self.landing_zone_x + dx
-                y = self.landing_zone_y + dy
-                if self.is_valid_pos(x, y):
-                    self.grid[y][x] = 10
+        lx, ly = self.landing_zone_x, self.landing_zone_y
+        self.target_pattern_arr = np.asarray(self.target_pattern, dtype=np.uint8)
+        self.landing_slice = (slice(ly, ly+2), slice(lx, lx+2))
+        self.grid[self.landing_slice] = 10
 
         # Target display
-        for dy in range(4):
-            for dx in range(4):
-                x = self.target_display_x - 1 + dx
-                y = self.target_display_y - 1 + dy
-                if self.is_valid_pos(x, y):
-                    self.grid[y][x] = 10
+        tx, ty = self.target_display_x, self.target_display_y
+        self.grid[ty-1:ty+3, tx-1:tx+3] = 10
 
         # Place target pattern
-        for dy in range(2):
-            for dx in range(2):
-                x = self.target_display_x + dx
-                y = self.target_display_y + dy
-                self.grid[y][x] = self.target_pattern[dy][dx]
+        self.grid[ty:ty+2, tx:tx+2] = self.target_pattern
 
         # Place blocks
-        self.grid[10][6] = 2   # Red
-        self.grid[12][14] = 4  # Yellow
-        self.grid[7][12] = 1   # Blue
-        self.grid[14][8] = 3   # Green
+        self.grid[10, 6] = 2   # Red
+        self.grid[12, 14] = 4  # Yellow
+        self.grid[7, 12] = 1   # Blue
+        self.grid[14, 8] = 3   # Green
 
         # Player start
         self.player_x = 10
@@ -221,14 +208,12 @@ class PatternThief:
     def setup_level_2(self):
         """Level 2: Gravity puzzle with lift mechanics."""
         # Clear grid
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                self.grid[y][x] = 0
+        self.grid.fill(0)
 
         # Target pattern (2x2 horizontal line)
-        self.target_pattern = [
+        self.target_pattern = np.array([
             [2, 4, 1, 3]  # Red, Yellow, Blue, Green in a row
-        ]
+        ], dtype=np.uint8)
 
         # Display positions
         self.target_display_x = 2
@@ -237,23 +222,16 @@ class PatternThief:
         self.landing_zone_y = 16  # Bottom area
 
         # Add border walls
-        for x in range(self.grid_size):
-            self.grid[0][x] = 5
-            self.grid[self.grid_size-1][x] = 5
-        for y in range(self.grid_size):
-            self.grid[y][0] = 5
-            self.grid[y][self.grid_size-1] = 5
+        self.grid[0, :] = self.grid[-1, :] = self.grid[:, 0] = self.grid[:, -1] = 5
 
         # Create landing zone enclosure (3 walls + door on top)
+        lx, ly = self.landing_zone_x, self.landing_zone_y
         # Bottom wall
-        for dx in range(6):
-            self.grid[self.landing_zone_y + 1][self.landing_zone_x + dx - 1] = 5
+        self.grid[ly+1, lx-1:lx+5] = 5
         # Left wall
-        for dy in range(3):
-            self.grid[self.landing_zone_y - dy][self.landing_zone_x - 1] = 5
+        self.grid[ly-2:ly+1, lx-1] = 5
         # Right wall
-        for dy in range(3):
-            self.grid[self.landing_zone_y - dy][self.landing_zone_x + 4] = 5
+        self.grid[ly-2:ly+1, lx+4] = 5
 
         # Sliding door (top of enclosure) - 6 brown tiles
         # Covers x=7-12 (6 tiles wide) at y=14
@@ -267,41 +245,32 @@ class PatternThief:
             self.door_closed_positions.append((x_closed, door_y))
             self.door_open_positions.append((x_open, door_y))
             self.door_cells.append((x_closed, door_y))  # Start closed
-            self.grid[door_y][x_closed] = 9  # Brown (maroon)
+            self.grid[door_y, x_closed] = 9  # Brown (maroon)
 
         # Landing zone floor
-        self.grid[self.landing_zone_y][self.landing_zone_x] = 10
-        self.grid[self.landing_zone_y][self.landing_zone_x + 1] = 10
-        self.grid[self.landing_zone_y][self.landing_zone_x + 2] = 10
-        self.grid[self.landing_zone_y][self.landing_zone_x + 3] = 10
-
-        # Target display - match landing zone exactly (4x1 with slate gray floor)
-        for dx in range(4):
-            x = self.target_display_x + dx
-            y = self.target_display_y
-            self.grid[y][x] = 10  # Slate gray floor, just like landing zone
-
-        # Place target pattern on top of floor
-        for dx in range(4):
-            x = self.target_display_x + dx
-            y = self.target_display_y
-            self.grid[y][x] = self.target_pattern[0][dx]
+        self.target_pattern_arr = np.asarray(self.target_pattern, dtype=np.uint8)
+        self.landing_slice = (slice(ly, ly+1), slice(lx, lx+4))
+        self.grid[self.landing_slice] = 10
+
+        # Target display - match landing zone exactly (4x1, pattern on slate gray floor)
+        tx, ty = self.target_display_x, self.target_display_y
+        self.grid[ty:ty+1, tx:tx+4] = self.target_pattern
 
         # Gravity trigger (orange square)
         self.gravity_trigger_x = 15
         self.gravity_trigger_y = 8
-        self.grid[self.gravity_trigger_y][self.gravity_trigger_x] = 7  # Orange
+        self.grid[self.gravity_trigger_y, self.gravity_trigger_x] = 7  # Orange
 
         # Door trigger (sky blue square)
         self.door_trigger_x = 15
         self.door_trigger_y = 11
-        self.grid[self.door_trigger_y][self.door_trigger_x] = 8  # Sky blue
+        self.grid[self.door_trigger_y, self.door_trigger_x] = 8  # Sky blue
 
         # Place blocks SCATTERED (not pre-aligned)
-        self.grid[6][5] = 2   # Red - top left area
-        self.grid[10][13] = 4  # Yellow - right side
-        self.grid[4][10] = 1  # Blue - top middle
-        self.grid[12][7] = 3  # Green - bottom left
+        self.grid[6, 5] = 2   # Red - top left area
+        self.grid[10, 13] = 4  # Yellow - right side
+        self.grid[4, 10] = 1  # Blue - top middle
+        self.grid[12, 7] = 3  # Green - bottom left
 
         # Player start
         self.player_x = 5
@@ -319,9 +288,7 @@ class PatternThief:
     def setup_level_3(self):
         """Level 3: Teleportation puzzle with fully enclosed target zone."""
         # Clear grid
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                self.grid[y][x] = 0
+        self.grid.fill(0)
 
         # Clear special blocks
         self.special_blocks = {}
@@ -329,29 +296,15 @@ class PatternThief:
         self.teleporter_unlocked = False
 
         # Border walls
-        for x in range(self.grid_size):
-            self.grid[0][x] = 5
-            self.grid[self.grid_size-1][x] = 5
-        for y in range(self.grid_size):
-            self.grid[y][0] = 5
-            self.grid[y][self.grid_size-1] = 5
+        self.grid[0, :] = self.grid[-1, :] = self.grid[:, 0] = self.grid[:, -1] = 5
 
         # Fully enclosed target zone (4x4 gray enclosure)
         zone_x, zone_y = 12, 12
         zone_size = 4
 
-        # Gray walls (all sides - fully enclosed)
-        for dx in range(zone_size + 2):
-            self.grid[zone_y - 1][zone_x - 1 + dx] = 5  # Top wall
-            self.grid[zone_y + zone_size][zone_x - 1 + dx] = 5  # Bottom wall
-        for dy in range(zone_size + 2):
-            self.grid[zone_y - 1 + dy][zone_x - 1] = 5  # Left wall
-            self.grid[zone_y - 1 + dy][zone_x + zone_size] = 5  # Right wall
-
-        # Gray floor inside
-        for dy in range(zone_size):
-            for dx in range(zone_size):
-                self.grid[zone_y + dy][zone_x + dx] = 10  # Slate gray
+        # Gray walls (all sides - fully enclosed), slate gray floor inside
+        self.grid[zone_y-1:zone_y+zone_size+1, zone_x-1:zone_x+zone_size+1] = 5
+        self.grid[zone_y:zone_y+zone_size, zone_x:zone_x+zone_size] = 10
 
         # Target pattern (non-contiguous, 4 blocks in 4x4 zone)
         # Stored as list of (x, y, color)
@@ -367,15 +320,9 @@ class PatternThief:
         self.target_display_y = 2
 
         # Frame around target display (4x4 to match enclosure)
-        for dy in range(6):
-            for dx in range(6):
-                x = self.target_display_x - 1 + dx
-                y = self.target_display_y - 1 + dy
-                if self.is_valid_pos(x, y):
-                    if dx == 0 or dx == 5 or dy == 0 or dy == 5:
-                        self.grid[y][x] = 5  # Gray frame
-                    else:
-                        self.grid[y][x] = 10  # Floor inside
+        tx, ty = self.target_display_x, self.target_display_y
+        self.grid[ty-1:ty+5, tx-1:tx+5] = 5  # Gray frame
+        self.grid[ty:ty+4, tx:tx+4] = 10  # Floor inside
 
         # Show target pattern in display
         for (target_x, target_y, color) in self.target_pattern_3:
@@ -384,27 +331,31 @@ class PatternThief:
             offset_y = target_y - zone_y
             display_x = self.target_display_x + offset_x
             display_y = self.target_display_y + offset_y
-            self.grid[display_y][display_x] = color
+            self.grid[display_y, display_x] = color
 
-        # Landing zone position (for checking)
+        # Landing zone position (for checking); the target cells are scattered,
+        # so index them with coordinate arrays instead of a rectangular slice
         self.landing_zone_x = zone_x
         self.landing_zone_y = zone_y
+        xs, ys, colors = zip(*self.target_pattern_3)
+        self.landing_slice = (np.array(ys), np.array(xs))
+        self.target_pattern_arr = np.array(colors, dtype=np.uint8)
 
         # Place solution blocks (scattered OUTSIDE enclosure - zone walls are at 11-16)
-        self.grid[5][5] = 2    # Red - top left, far from zone
-        self.grid[6][17] = 1   # Blue - right side, outside zone
-        self.grid[17][6] = 4   # Yellow - bottom left, outside zone
-        self.grid[17][17] = 3  # Green - bottom right, outside zone
+        self.grid[5, 5] = 2    # Red - top left, far from zone
+        self.grid[6, 17] = 1   # Blue - right side, outside zone
+        self.grid[17, 6] = 4   # Yellow - bottom left, outside zone
+        self.grid[17, 17] = 3  # Green - bottom right, outside zone
 
         # Place teleporter (yellow rim/red center) - Use grid value 20
         teleporter_x, teleporter_y = 10, 5
-        self.grid[teleporter_y][teleporter_x] = 20  # Special value for teleporter
+        self.grid[teleporter_y, teleporter_x] = 20  # Special value for teleporter
         self.special_blocks[(teleporter_x, teleporter_y)] = {'type': 'teleporter'}
         self.teleporter_pos = (teleporter_x, teleporter_y)
 
         # Place teleporter mover (red rim/yellow center) - Use grid value 21
         mover_x, mover_y = 12, 7
-        self.grid[mover_y][mover_x] = 21  # Special value for teleporter mover
+        self.grid[mover_y, mover_x] = 21  # Special value for teleporter mover
         self.special_blocks[(mover_x, mover_y)] = {'type': 'teleporter_mover'}
 
         # Player start
@@ -424,13 +375,13 @@ class PatternThief:
         """Check if position is a wall."""
         if not self.is_valid_pos(x, y):
             return True
-        return self.grid[y][x] == 5
+        return self.grid[y, x] == 5
 
     def is_block(self, x: int, y: int) -> bool:
         """Check if position has a pushable block."""
         if not self.is_valid_pos(x, y):
             return False
-        color = self.grid[y][x]
+        color = self.grid[y, x]
         # Normal blocks (1-4) + special blocks (20-21)
         if color in [1, 2, 3, 4]:
             return True
@@ -457,7 +408,7 @@ class PatternThief:
             if (x, y) in self.door_closed_positions:
                 return True
 
-        color = self.grid[y][x]
+        color = self.grid[y, x]
         # Empty, floor (10), triggers (7=gravity, 8=door)
         return color == 0 or color == 10 or color == 7 or color == 8
 
@@ -495,7 +446,7 @@ class PatternThief:
             return None
 
         # Only teleport if on teleporter
-        if self.grid[y][x] != 20:  # Not on teleporter
+        if self.grid[y, x] != 20:  # Not on teleporter
             return None
 
         # Calculate target position (4 spaces away, ignoring walls)
@@ -507,7 +458,7 @@ class PatternThief:
             return None
 
         # Can land on empty space, floor, or landing zone
-        target_cell = self.grid[target_y][target_x]
+        target_cell = self.grid[target_y, target_x]
         if target_cell in [0, 10] or self.is_landing_zone_pos(target_x, target_y):
             return (target_x, target_y)
 
@@ -521,10 +472,10 @@ class PatternThief:
         # Check if this position is the teleporter and something pushed onto it
         if (x, y) == self.teleporter_pos:
             # If mover was pushed onto teleporter, unlock it
-            if self.grid[y][x] == 21:  # Teleporter mover
+            if self.grid[y, x] == 21:  # Teleporter mover
                 self.teleporter_unlocked = True
                 # Remove mover (consumed by interaction)
-                self.grid[y][x] = 20  # Just teleporter remains
+                self.grid[y, x] = 20  # Just teleporter remains
                 if (x, y) in self.special_blocks and self.special_blocks[(x, y)]['type'] == 'teleporter_mover':
                     del self.special_blocks[(x, y)]
 
@@ -552,12 +503,12 @@ class PatternThief:
         # Check block
         if self.is_block(new_x, new_y):
             if self.can_push_block(new_x, new_y, dx, dy):
-                block_color = self.grid[new_y][new_x]
+                block_color = self.grid[new_y, new_x]
                 behind_x = new_x + dx
                 behind_y = new_y + dy
 
                 # Move block
-                self.grid[behind_y][behind_x] = block_color
+                self.grid[behind_y, behind_x] = block_color
 
                 # Update special blocks dict if moving special block
                 if (new_x, new_y) in self.special_blocks:
@@ -570,15 +521,15 @@ class PatternThief:
 
                 # Clear old position
                 if self.is_landing_zone_pos(new_x, new_y):
-                    self.grid[new_y][new_x] = 10
+                    self.grid[new_y, new_x] = 10
                 elif (new_x, new_y) == (self.gravity_trigger_x, self.gravity_trigger_y):
-                    self.grid[new_y][new_x] = 7  # Restore trigger
+                    self.grid[new_y, new_x] = 7  # Restore trigger
                 elif (new_x, new_y) == (self.door_trigger_x, self.door_trigger_y):
-                    self.grid[new_y][new_x] = 8  # Restore trigger
+                    self.grid[new_y, new_x] = 8  # Restore trigger
                 elif (new_x, new_y) == self.teleporter_pos and self.current_level == 3:
-                    self.grid[new_y][new_x] = 20  # Restore teleporter if block pushed off it
+                    self.grid[new_y, new_x] = 20  # Restore teleporter if block pushed off it
                 else:
-                    self.grid[new_y][new_x] = 0
+                    self.grid[new_y, new_x] = 0
 
                 # Move player
                 self.player_x = new_x
@@ -593,20 +544,20 @@ class PatternThief:
                     if teleport_result:
                         teleport_x, teleport_y = teleport_result
                         # Move block to teleport destination
-                        self.grid[teleport_y][teleport_x] = block_color
+                        self.grid[teleport_y, teleport_x] = block_color
                         # Clear block from behind position
                         if self.is_landing_zone_pos(behind_x, behind_y):
-                            self.grid[behind_y][behind_x] = 10
+                            self.grid[behind_y, behind_x] = 10
                         elif (behind_x, behind_y) == self.teleporter_pos:
-                            self.grid[behind_y][behind_x] = 20  # Restore teleporter
+                            self.grid[behind_y, behind_x] = 20  # Restore teleporter
                         else:
-                            self.grid[behind_y][behind_x] = 0
+                            self.grid[behind_y, behind_x] = 0
 
                 self.check_game_state()
             return
 
         # Normal movement
-        if self.is_empty_or_floor(new_x, new_y) or (self.current_level == 3 and self.grid[new_y][new_x] == 20):
+        if self.is_empty_or_floor(new_x, new_y) or (self.current_level == 3 and self.grid[new_y, new_x] == 20):
             self.player_x = new_x
             self.player_y = new_y
 
@@ -617,7 +568,7 @@ class PatternThief:
                 # Door state is now updated in update() every frame
 
             # Level 3: Check if player landed on teleporter
-            if self.current_level == 3 and self.grid[new_y][new_x] == 20:
+            if self.current_level == 3 and self.grid[new_y, new_x] == 20:
                 teleport_result = self.try_teleport(new_x, new_y, dx, dy, is_player=True)
                 if teleport_result:
                     self.player_x, self.player_y = teleport_result
@@ -654,16 +605,16 @@ class PatternThief:
             if (self.is_valid_pos(above_x, block_dest_y) and
                 self.is_empty_or_floor(above_x, block_dest_y)):
                 # Lift both
-                block_color = self.grid[above_y][above_x]
+                block_color = self.grid[above_y, above_x]
 
                 # Move block up
-                self.grid[block_dest_y][above_x] = block_color
+                self.grid[block_dest_y, above_x] = block_color
 
                 # Clear old block position
                 if self.is_landing_zone_pos(above_x, above_y):
-                    self.grid[above_y][above_x] = 10
+                    self.grid[above_y, above_x] = 10
                 else:
-                    self.grid[above_y][above_x] = 0
+                    self.grid[above_y, above_x] = 0
 
                 # Move player up
                 self.player_y = player_dest_y
@@ -677,13 +628,13 @@ class PatternThief:
             if (self.is_valid_pos(left_x, block_dest_y) and
                 self.is_empty_or_floor(left_x, block_dest_y)):
                 # Lift block only
-                block_color = self.grid[left_y][left_x]
-                self.grid[block_dest_y][left_x] = block_color
+                block_color = self.grid[left_y, left_x]
+                self.grid[block_dest_y, left_x] = block_color
 
                 if self.is_landing_zone_pos(left_x, left_y):
-                    self.grid[left_y][left_x] = 10
+                    self.grid[left_y, left_x] = 10
                 else:
-                    self.grid[left_y][left_x] = 0
+                    self.grid[left_y, left_x] = 0
                 return
 
         # Check right
@@ -694,13 +645,13 @@ class PatternThief:
             if (self.is_valid_pos(right_x, block_dest_y) and
                 self.is_empty_or_floor(right_x, block_dest_y)):
                 # Lift block only
-                block_color = self.grid[right_y][right_x]
-                self.grid[block_dest_y][right_x] = block_color
+                block_color = self.grid[right_y, right_x]
+                self.grid[block_dest_y, right_x] = block_color
 
                 if self.is_landing_zone_pos(right_x, right_y):
-                    self.grid[right_y][right_x] = 10
+                    self.grid[right_y, right_x] = 10
                 else:
-                    self.grid[right_y][right_x] = 0
+                    self.grid[right_y, right_x] = 0
                 return
 
     def trigger_gravity(self):
@@ -713,7 +664,7 @@ class PatternThief:
         for y in range(self.grid_size):
             for x in range(self.grid_size):
                 if self.is_block(x, y) and not self.is_in_target_display(x, y):
-                    color = self.grid[y][x]
+                    color = self.grid[y, x]
 
                     # Find lowest empty position in this column
                     fall_y = y
@@ -736,13 +687,13 @@ class PatternThief:
 
                         # Clear old position
                         if self.is_landing_zone_pos(x, y):
-                            self.grid[y][x] = 10
+                            self.grid[y, x] = 10
                         elif (x, y) == (self.gravity_trigger_x, self.gravity_trigger_y):
-                            self.grid[y][x] = 7
+                            self.grid[y, x] = 7
                         elif (x, y) == (self.door_trigger_x, self.door_trigger_y):
-                            self.grid[y][x] = 8
+                            self.grid[y, x] = 8
                         else:
-                            self.grid[y][x] = 0
+                            self.grid[y, x] = 0
 
         if self.falling_blocks:
             self.gravity_active = True
@@ -766,11 +717,11 @@ class PatternThief:
 
                     # Clear old position (only if no block there)
                     if not self.is_block(x_old, y_old):
-                        self.grid[y_old][x_old] = 0
+                        self.grid[y_old, x_old] = 0
 
                     # Place at new position
                     if self.is_valid_pos(x_new, y_new):
-                        self.grid[y_new][x_new] = 9  # Brown
+                        self.grid[y_new, x_new] = 9  # Brown
 
                 # Update door_cells to new positions
                 self.door_cells = list(self.door_open_positions)
@@ -782,67 +733,24 @@ class PatternThief:
 
                     # Clear old position
                     if self.is_valid_pos(x_old, y_old):
-                        self.grid[y_old][x_old] = 0
+                        self.grid[y_old, x_old] = 0
 
                     # Place at new position (only if no block there)
                     if not self.is_block(x_new, y_new):
-                        self.grid[y_new][x_new] = 9  # Brown
+                        self.grid[y_new, x_new] = 9  # Brown
 
                 # Update door_cells to closed positions
                 self.door_cells = list(self.door_closed_positions)
 
     def check_game_state(self):
         """Check win condition."""
-        if self.current_level == 1:
-            # Check 2x2 pattern
-            match = True
-            for dy in range(2):
-                for dx in range(2):
-                    x = self.landing_zone_x + dx
-                    y = self.landing_zone_y + dy
-                    expected = self.target_pattern[dy][dx]
-                    actual = self.grid[y][x]
-                    if actual != expected:
-                        match = False
-                        break
-                if not match:
-                    break
-
-            if match:
-                self.won = True
-                self.flash_timer = pygame.time.get_ticks()
-                self.completed_levels.add(1)
-
-        elif self.current_level == 2:
-            # Check 1x4 pattern
-            match = True
-            for dx in range(4):
-                x = self.landing_zone_x + dx
-                y = self.landing_zone_y
-                expected = self.target_pattern[0][dx]
-                actual = self.grid[y][x]
-                if actual != expected:
-                    match = False
-                    break
-
-            if match:
-                self.won = True
-                self.flash_timer = pygame.time.get_ticks()
-                self.completed_levels.add(2)
+        if self.current_level not in (1, 2, 3):
+            return
 
-        elif self.current_level == 3:
-            # Check non-contiguous 4-block pattern
-            match = True
-            for (target_x, target_y, expected_color) in self.target_pattern_3:
-                actual = self.grid[target_y][target_x]
-                if actual != expected_color:
-                    match = False
-                    break
-
-            if match:
-                self.won = True
-                self.flash_timer = pygame.time.get_ticks()
-                self.completed_levels.add(3)
+        if np.array_equal(self.grid[self.landing_slice], self.target_pattern_arr):
+            self.won = True
+            self.flash_timer = pygame.time.get_ticks()
+            self.completed_levels.add(self.current_level)
 
     def reset_game(self):
         """Reset current level."""
@@ -883,19 +791,19 @@ class PatternThief:
                     if can_fall:
                         # Clear current position
                         if self.is_landing_zone_pos(x, y):
-                            self.grid[y][x] = 10
+                            self.grid[y, x] = 10
                         elif (x, y) == (self.gravity_trigger_x, self.gravity_trigger_y):
-                            self.grid[y][x] = 7
+                            self.grid[y, x] = 7
                         elif (x, y) == (self.door_trigger_x, self.door_trigger_y):
-                            self.grid[y][x] = 8
+                            self.grid[y, x] = 8
                         else:
-                            self.grid[y][x] = 0
+                            self.grid[y, x] = 0
 
                         # Move down one cell
                         block['current_y'] = next_y
 
                         # Place at new position
-                        self.grid[next_y][x] = block['color']
+                        self.grid[next_y, x] = block['color']
                         all_finished = False
 
                 if all_finished:
@@ -1038,7 +946,7 @@ class PatternThief:
                 rect = pygame.Rect(x * self.cell_size, y * self.cell_size,
                                  self.cell_size, self.cell_size)
 
-                cell_value = self.grid[y][x]
+                cell_value = self.grid[y, x]
 
                 # Handle special blocks (Level 3)
                 if cell_value == 20:  # Teleporter (yellow rim, red center)
@@ -27,12 +27,53 @@ Controls:
 import sys
 import os
 import pygame
-from typing import Set, Tuple
+import numpy as np
 from enum import Enum
 
 # Add tools to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
-from arc_agi_editor.editor.utils import ARC_COLORS
+from arc_agi_editor.editor.utils import ARC_COLORS, ARC_PALETTE
+
+# scipy is optional; flood fill labels regions with it when available
+try:
+    from scipy import ndimage
+except ImportError:
+    ndimage = None
+
+def _region_mask(grid: np.ndarray, start_x: int, start_y: int) -> np.ndarray:
+    """Scanline fill of the 4-connected region of the start cell's color."""
+    height, width = grid.shape
+    region = grid == grid[start_y, start_x]
+    mask = np.zeros_like(region)
+    stack = [(start_x, start_y)]
+    
+    while stack:
+        x, y = stack.pop()
+        if mask[y, x]:
+            continue
+        
+        # Extend this row's run as far as the region goes in both directions
+        left = x
+        while left > 0 and region[y, left - 1]:
+            left -= 1
+        right = x
+        while right < width - 1 and region[y, right + 1]:
+            right += 1
+        mask[y, left:right + 1] = True
+        
+        # Seed the start of every unfilled run in the rows above and below
+        for ny in (y - 1, y + 1):
+            if 0 <= ny < height:
+                in_run = False
+                for nx in range(left, right + 1):
+                    if region[ny, nx] and not mask[ny, nx]:
+                        if not in_run:
+                            stack.append((nx, ny))
+                            in_run = True
+                    else:
+                        in_run = False
+    
+    return mask
 
 class Direction(Enum):
     UP = (0, -1)
@@ -55,8 +96,15 @@ class ColorFlood:
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("Color Flood - ARC-AGI-3 v2.0")
         
-        # ARC color palette
+        # Input is keyboard-only; have SDL drop mouse motion etc. before it
+        # ever reaches the event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        
+        # ARC color palette (dict for UI lookups, array indexed by cell value for the grid)
         self.arc_colors = ARC_COLORS
+        self.palette = ARC_PALETTE
+        self.gridlines = self.render_gridlines()
         
         # Game state
         self.clock = pygame.time.Clock()
@@ -64,7 +112,7 @@ class ColorFlood:
         self.fps = 10
         
         # Grid state
-        self.grid = [[0 for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        self.grid = np.zeros((self.grid_size, self.grid_size), dtype=np.uint8)
         # Using extended 16-color palette for variety
         self.colors_available = [1, 2, 3, 4, 6, 7, 8]  # Blue, Red, Green, Yellow, Magenta, Orange, Sky Blue
         self.current_color = 1
@@ -81,6 +129,15 @@ class ColorFlood:
         self.flash_timer = 0
         self.flash_duration = 1000  # ms
 
+        # KEYDOWN dispatch: key -> (handler, argument), one dict lookup per press
+        self.key_bindings = {pygame.K_r: (self.reset_game, None)}
+        for key in (pygame.K_a, pygame.K_LEFT):
+            self.key_bindings[key] = (self.select_color, Direction.LEFT)
+        for key in (pygame.K_d, pygame.K_RIGHT):
+            self.key_bindings[key] = (self.select_color, Direction.RIGHT)
+        for key in (pygame.K_w, pygame.K_UP, pygame.K_s, pygame.K_DOWN, pygame.K_SPACE):
+            self.key_bindings[key] = (self.perform_flood, None)
+
         self.setup_level()
 
     def create_levels(self):
@@ -183,14 +240,14 @@ class ColorFlood:
         level_data = self.levels[self.current_level % len(self.levels)]
 
         # Load grid from level
-        self.grid = [row[:] for row in level_data['grid']]  # Deep copy
+        self.grid = np.array(level_data['grid'], dtype=np.uint8)  # Deep copy
         self.max_moves = level_data['max_moves']
 
         # Set target color from bottom-right corner
-        self.target_color = self.grid[self.grid_size - 1][self.grid_size - 1]
+        self.target_color = int(self.grid[self.grid_size - 1, self.grid_size - 1])
 
         # Starting color is top-left
-        self.current_color = self.grid[0][0]
+        self.current_color = int(self.grid[0, 0])
 
         # Reset game state
         self.moves_used = 0
@@ -198,54 +255,32 @@ class ColorFlood:
         self.lost = False
         self.flash_timer = 0
     
-    def get_flood_fill_cells(self, start_x: int, start_y: int, target_color: int) -> Set[Tuple[int, int]]:
-        """Get all cells that would be affected by flood fill."""
+    def get_flood_fill_mask(self, start_x: int, start_y: int, target_color: int) -> np.ndarray:
+        """Get a boolean mask of the cells that would be affected by flood fill."""
         if start_x < 0 or start_x >= self.grid_size or start_y < 0 or start_y >= self.grid_size:
-            return set()
+            return np.zeros(self.grid.shape, dtype=bool)
         
-        original_color = self.grid[start_y][start_x]
+        original_color = self.grid[start_y, start_x]
         if original_color == target_color:
-            return set()
+            return np.zeros(self.grid.shape, dtype=bool)
         
-        visited = set()
-        to_visit = [(start_x, start_y)]
-        
-        while to_visit:
-            x, y = to_visit.pop()
-            
-            if (x, y) in visited:
-                continue
-            
-            if x < 0 or x >= self.grid_size or y < 0 or y >= self.grid_size:
-                continue
-            
-            if self.grid[y][x] != original_color:
-                continue
-            
-            visited.add((x, y))
-            
-            # Add neighbors
-            to_visit.extend([(x+1, y), (x-1, y), (x, y+1), (x, y-1)])
+        if ndimage is None:
+            return _region_mask(self.grid, start_x, start_y)
         
-        return visited
+        # Label the 4-connected regions of the start color and keep the start's one
+        labels, _ = ndimage.label(self.grid == original_color)
+        return labels == labels[start_y, start_x]
     
     def flood_fill(self, start_x: int, start_y: int, new_color: int):
         """Perform flood fill from starting position."""
-        cells_to_change = self.get_flood_fill_cells(start_x, start_y, new_color)
+        cells_to_change = self.get_flood_fill_mask(start_x, start_y, new_color)
+        self.grid[cells_to_change] = new_color
         
-        for x, y in cells_to_change:
-            self.grid[y][x] = new_color
-        
-        return len(cells_to_change) > 0
+        return bool(cells_to_change.any())
     
     def check_win_condition(self):
         """Check if all cells match the target color (bottom-right corner)."""
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                if self.grid[y][x] != self.target_color:
-                    return False
-
-        return True
+        return bool((self.grid == self.target_color).all())
     
     def select_color(self, direction: Direction):
         """Select color based on direction."""
@@ -350,19 +385,28 @@ class ColorFlood:
             
             pygame.draw.rect(self.screen, (100, 100, 100), rect, 1)
     
+    def render_gridlines(self):
+        """Build the cell outline overlay once; it only depends on the layout."""
+        size = self.grid_size * self.cell_size
+        overlay = pygame.Surface((size, size))
+        overlay.fill((0, 0, 0))
+        for y in range(self.grid_size):
+            for x in range(self.grid_size):
+                rect = pygame.Rect(x * self.cell_size, y * self.cell_size,
+                                 self.cell_size, self.cell_size)
+                pygame.draw.rect(overlay, (50, 50, 50), rect, 1)
+        overlay.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return overlay
+    
     def draw(self):
         """Draw the game."""
         self.screen.fill(self.arc_colors[0])  # Black background
         
-        # Draw main grid
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                rect = pygame.Rect(x * self.cell_size, y * self.cell_size, 
-                                 self.cell_size, self.cell_size)
-                
-                cell_color = self.grid[y][x]
-                pygame.draw.rect(self.screen, self.arc_colors[cell_color], rect)
-                pygame.draw.rect(self.screen, (50, 50, 50), rect, 1)
+        # Draw main grid: one cell-per-pixel image scaled up, then the outlines
+        size = self.grid_size * self.cell_size
+        cells = pygame.surfarray.make_surface(self.palette[self.grid].swapaxes(0, 1))
+        self.screen.blit(pygame.transform.scale(cells, (size, size)), (0, 0))
+        self.screen.blit(self.gridlines, (0, 0))
         
         # Draw UI elements
         self.draw_target_indicator()  # Show goal color
@@ -400,18 +444,14 @@ class ColorFlood:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
-                elif event.key == pygame.K_r:
-                    self.reset_game()
-                
-                # Color selection
-                elif event.key in [pygame.K_a, pygame.K_LEFT]:
-                    self.select_color(Direction.LEFT)
-                elif event.key in [pygame.K_d, pygame.K_RIGHT]:
-                    self.select_color(Direction.RIGHT)
-                
-                # Perform flood fill
-                elif event.key in [pygame.K_w, pygame.K_UP, pygame.K_s, pygame.K_DOWN, pygame.K_SPACE]:
-                    self.perform_flood()
+                else:
+                    binding = self.key_bindings.get(event.key)
+                    if binding:
+                        handler, arg = binding
+                        if arg is None:
+                            handler()
+                        else:
+                            handler(arg)
     
     def run(self):
         """Main game loop."""
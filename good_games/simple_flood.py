@@ -21,6 +21,7 @@ import sys
 import os
 import pygame
 import random
+from collections import deque
 from typing import Set, Tuple
 from enum import Enum
 
@@ -48,6 +49,11 @@ class SimpleFlood:
         self.screen_height = self.grid_size * self.cell_size + 120  # Extra space for UI
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("Simple Color Flood - ARC-AGI-3 v2.0")
+        
+        # Input is keyboard-only; have SDL drop mouse motion etc. before it
+        # ever reaches the event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
 
         # Game state
         self.clock = pygame.time.Clock()
@@ -55,7 +61,8 @@ class SimpleFlood:
         self.fps = 10
 
         # Grid state
-        self.grid = [[0 for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # One byte per cell, row-major: cell (x, y) lives at y * grid_size + x
+        self.grid = bytearray(self.grid_size * self.grid_size)
         # Using extended 16-color palette for variety
         self.colors_available = [1, 2, 3, 4, 6, 7, 8]  # Blue, Red, Green, Yellow, Magenta, Orange, Sky Blue
         self.current_color = 1
@@ -68,17 +75,38 @@ class SimpleFlood:
         self.flash_timer = 0
         self.flash_duration = 1000  # ms
         
+        # One pre-rendered cell tile per color, outline baked in, blitted
+        # at precomputed cell positions
+        self.tiles = []
+        for color in range(len(ARC_COLORS)):
+            tile = pygame.Surface((self.cell_size, self.cell_size))
+            tile.fill(ARC_COLORS[color])
+            pygame.draw.rect(tile, (50, 50, 50), tile.get_rect(), 1)
+            self.tiles.append(tile)
+        self.cell_positions = [(x * self.cell_size, y * self.cell_size)
+                               for y in range(self.grid_size) for x in range(self.grid_size)]
+        
+        # Set whenever something on screen changes; draw() skips clean frames
+        self.dirty = True
+        
+        # KEYDOWN dispatch: key -> (handler, argument), one dict lookup per press
+        self.key_bindings = {pygame.K_r: (self.reset_game, None)}
+        for key in (pygame.K_a, pygame.K_LEFT):
+            self.key_bindings[key] = (self.select_color, Direction.LEFT)
+        for key in (pygame.K_d, pygame.K_RIGHT):
+            self.key_bindings[key] = (self.select_color, Direction.RIGHT)
+        for key in (pygame.K_w, pygame.K_UP, pygame.K_s, pygame.K_DOWN, pygame.K_SPACE):
+            self.key_bindings[key] = (self.perform_flood, None)
+        
         self.setup_level()
     
     def setup_level(self):
         """Setup a random level."""
         # Fill grid with random colors
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                self.grid[y][x] = random.choice(self.colors_available)
+        self.grid[:] = bytes(random.choice(self.colors_available) for _ in range(len(self.grid)))
         
         # Starting corner is always color 1
-        self.grid[0][0] = 1
+        self.grid[0] = 1
         self.current_color = 1
         
         # Reset game state
@@ -86,35 +114,36 @@ class SimpleFlood:
         self.won = False
         self.lost = False
         self.flash_timer = 0
+        self.dirty = True
     
     def get_flood_fill_cells(self, start_x: int, start_y: int, target_color: int) -> Set[Tuple[int, int]]:
         """Get all cells that would be affected by flood fill."""
         if start_x < 0 or start_x >= self.grid_size or start_y < 0 or start_y >= self.grid_size:
             return set()
         
-        original_color = self.grid[start_y][start_x]
+        original_color = self.grid[start_y * self.grid_size + start_x]
         if original_color == target_color:
             return set()
         
+        # Check bounds, color and the visited map before enqueueing, so each
+        # cell is queued at most once
+        size = self.grid_size
+        grid = self.grid
+        seen = bytearray(size * size)
+        seen[start_y * size + start_x] = 1
+        to_visit = deque([(start_x, start_y)])
         visited = set()
-        to_visit = [(start_x, start_y)]
         
         while to_visit:
-            x, y = to_visit.pop()
-            
-            if (x, y) in visited:
-                continue
-            
-            if x < 0 or x >= self.grid_size or y < 0 or y >= self.grid_size:
-                continue
-            
-            if self.grid[y][x] != original_color:
-                continue
-            
+            x, y = to_visit.popleft()
             visited.add((x, y))
             
-            # Add neighbors
-            to_visit.extend([(x+1, y), (x-1, y), (x, y+1), (x, y-1)])
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if 0 <= nx < size and 0 <= ny < size:
+                    index = ny * size + nx
+                    if not seen[index] and grid[index] == original_color:
+                        seen[index] = 1
+                        to_visit.append((nx, ny))
         
         return visited
     
@@ -122,21 +151,18 @@ class SimpleFlood:
         """Perform flood fill from starting position."""
         cells_to_change = self.get_flood_fill_cells(start_x, start_y, new_color)
         
+        size = self.grid_size
         for x, y in cells_to_change:
-            self.grid[y][x] = new_color
+            self.grid[y * size + x] = new_color
         
+        if cells_to_change:
+            self.dirty = True
         return len(cells_to_change) > 0
     
     def check_win_condition(self):
         """Check if all cells are the same color."""
-        first_color = self.grid[0][0]
-        
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                if self.grid[y][x] != first_color:
-                    return False
-        
-        return True
+        first_color = self.grid[0]
+        return self.grid.count(first_color) == len(self.grid)
     
     def select_color(self, direction: Direction):
         """Select color based on direction."""
@@ -150,6 +176,7 @@ class SimpleFlood:
             return  # Up/Down don't change color
         
         self.current_color = self.colors_available[new_index]
+        self.dirty = True
     
     def perform_flood(self):
         """Perform flood fill with current color."""
@@ -185,17 +212,20 @@ class SimpleFlood:
     
     def draw(self):
         """Draw the game."""
+        # The puzzle is input-driven: unless the state changed or the win/loss
+        # flash is fading, the last frame is still on screen
+        flashing = (self.won or self.lost) and self.flash_timer > 0
+        if not (self.dirty or flashing):
+            return
+        self.dirty = False
+        
         self.screen.fill(ARC_COLORS[0])  # Black background
         
-        # Draw main grid
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                rect = pygame.Rect(x * self.cell_size, y * self.cell_size, 
-                                 self.cell_size, self.cell_size)
-                
-                cell_color = self.grid[y][x]
-                pygame.draw.rect(self.screen, ARC_COLORS[cell_color], rect)
-                pygame.draw.rect(self.screen, (50, 50, 50), rect, 1)
+        # Draw main grid: one tile blit per cell, all in a single call
+        tiles = self.tiles
+        self.screen.blits([(tiles[color], position)
+                           for color, position in zip(self.grid, self.cell_positions)],
+                          doreturn=False)
         
         # Draw UI at bottom
         ui_y = self.grid_size * self.cell_size + 10
@@ -248,18 +278,14 @@ class SimpleFlood:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
-                elif event.key == pygame.K_r:
-                    self.reset_game()
-                
-                # Color selection
-                elif event.key in [pygame.K_a, pygame.K_LEFT]:
-                    self.select_color(Direction.LEFT)
-                elif event.key in [pygame.K_d, pygame.K_RIGHT]:
-                    self.select_color(Direction.RIGHT)
-                
-                # Perform flood fill
-                elif event.key in [pygame.K_w, pygame.K_UP, pygame.K_s, pygame.K_DOWN, pygame.K_SPACE]:
-                    self.perform_flood()
+                else:
+                    binding = self.key_bindings.get(event.key)
+                    if binding:
+                        handler, arg = binding
+                        if arg is None:
+                            handler()
+                        else:
+                            handler(arg)
     
     def run(self):
         """Main game loop."""
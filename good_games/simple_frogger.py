@@ -28,6 +28,7 @@ import sys
 import os
 import pygame
 import random
+import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
 
@@ -41,6 +42,9 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+# (dx, dy) per direction, so movement skips the Enum .value descriptor
+_DELTAS = {direction: direction.value for direction in Direction}
+
 class LaneType(Enum):
     SAFE = 0
     ROAD = 1
@@ -49,6 +53,8 @@ class LaneType(Enum):
 
 class GameObject:
     """Base class for all game objects."""
+    __slots__ = ('x', 'y', 'color', 'width', 'height', 'active')
+    
     def __init__(self, x: int, y: int, color: int, width: int = 1, height: int = 1):
         self.x = x
         self.y = y
@@ -68,6 +74,8 @@ class GameObject:
 
 class Player(GameObject):
     """Player-controlled frog."""
+    __slots__ = ('spawn_x', 'spawn_y', 'on_log', 'current_log', 'log_offset')
+    
     def __init__(self, x: int, y: int):
         super().__init__(x, y, color=3)  # Green for player
         self.spawn_x = x
@@ -77,7 +85,7 @@ class Player(GameObject):
         self.log_offset = 0
     
     def move(self, direction: Direction, grid_width: int, grid_height: int):
-        dx, dy = direction.value
+        dx, dy = _DELTAS[direction]
         new_x = max(0, min(grid_width - 1, self.x + dx))
         new_y = max(0, min(grid_height - 1, self.y + dy))
         
@@ -100,30 +108,107 @@ class Player(GameObject):
         # Player position is handled by log movement in collision detection
         pass
 
+class ObstacleArrays:
+    """Struct-of-arrays state for every moving obstacle.
+    
+    Obstacles step together each frame, so their positions, sizes, colors
+    and move timers live in parallel numpy columns and update() advances
+    all of them at once. MovingObstacle is a view onto one index.
+    """
+    def __init__(self, wrap_width: int, capacity: int = 16):
+        self.wrap_width = wrap_width
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.width = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self.dx = np.zeros(capacity, dtype=np.int32)
+        self.move_timer = np.zeros(capacity, dtype=np.float64)
+        self.move_interval = np.zeros(capacity, dtype=np.float64)
+    
+    def add(self, x: int, y: int, color: int, speed: float, direction: Direction,
+            width: int = 1) -> 'MovingObstacle':
+        """Append an obstacle, doubling the columns when full, and return its view."""
+        if self.count == len(self.x):
+            capacity = 2 * len(self.x)
+            for name in ('x', 'y', 'width', 'color', 'dx', 'move_timer', 'move_interval'):
+                column = getattr(self, name)
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:self.count] = column
+                setattr(self, name, grown)
+        
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.width[i] = width
+        self.color[i] = color
+        self.dx[i] = _DELTAS[direction][0]
+        self.move_timer[i] = 0
+        self.move_interval[i] = 1000 / abs(speed) if speed != 0 else float('inf')
+        self.count += 1
+        return MovingObstacle(self, i, speed, direction)
+    
+    def clear(self):
+        self.count = 0
+    
+    def update(self, dt: float):
+        n = self.count
+        move_timer = self.move_timer[:n]
+        move_timer += dt
+        moved = move_timer >= self.move_interval[:n]
+        if not moved.any():
+            return  # Most frames nothing is due to step
+        
+        x = self.x[:n]
+        width = self.width[:n]
+        x[moved] += self.dx[:n][moved]
+        move_timer[moved] = 0
+        
+        # Wrap around screen
+        off_left = moved & (x < -width)
+        off_right = moved & (x >= self.wrap_width)
+        x[off_left] = self.wrap_width
+        x[off_right] = -width[off_right]
+
 class MovingObstacle(GameObject):
-    """Moving obstacle (car, log, turtle)."""
-    def __init__(self, x: int, y: int, color: int, speed: float, direction: Direction, width: int = 1):
-        super().__init__(x, y, color, width, 1)
+    """Moving obstacle (car, log, turtle), viewing one slot of ObstacleArrays."""
+    __slots__ = ('arrays', 'index', 'speed', 'direction')
+    
+    def __init__(self, arrays: ObstacleArrays, index: int, speed: float, direction: Direction):
+        self.arrays = arrays
+        self.index = index
         self.speed = speed
         self.direction = direction
-        self.move_timer = 0
-        self.move_interval = 1000 / abs(speed) if speed != 0 else float('inf')
+        self.height = 1
+        self.active = True
     
-    def update(self, dt: float):
-        if self.speed == 0:
-            return
-        
-        self.move_timer += dt
-        if self.move_timer >= self.move_interval:
-            dx, dy = self.direction.value
-            self.x += dx
-            self.move_timer = 0
-            
-            # Wrap around screen
-            if self.x < -self.width:
-                self.x = 16
-            elif self.x >= 16:
-                self.x = -self.width
+    @property
+    def x(self) -> int:
+        return int(self.arrays.x[self.index])
+    
+    @x.setter
+    def x(self, value: int):
+        self.arrays.x[self.index] = value
+    
+    @property
+    def y(self) -> int:
+        return int(self.arrays.y[self.index])
+    
+    @property
+    def width(self) -> int:
+        return int(self.arrays.width[self.index])
+    
+    @property
+    def color(self) -> int:
+        return int(self.arrays.color[self.index])
+    
+    @property
+    def move_timer(self) -> float:
+        return float(self.arrays.move_timer[self.index])
+    
+    @property
+    def move_interval(self) -> float:
+        return float(self.arrays.move_interval[self.index])
 
 class Lane:
     """Represents a lane in the Frogger game."""
@@ -136,10 +221,6 @@ class Lane:
     
     def add_obstacle(self, obstacle: MovingObstacle):
         self.obstacles.append(obstacle)
-    
-    def update(self, dt: float):
-        for obstacle in self.obstacles:
-            obstacle.update(dt)
 
 class SimpleFrogger:
     """Simple Frogger game."""
@@ -157,6 +238,22 @@ class SimpleFrogger:
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("River Crossing - ARC-AGI-3 v2.0")
         
+        # Input is keyboard-only; have SDL drop mouse motion etc. before it
+        # ever reaches the event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        
+        # Rects for the fixed grid layout, built once and reused every frame
+        self.cell_rects = [[pygame.Rect(x * self.cell_size, y * self.cell_size,
+                                        self.cell_size, self.cell_size)
+                            for x in range(self.grid_width)]
+                           for y in range(self.grid_height)]
+        
+        # Lanes and grid lines only change with the layout, so they are
+        # composited into one board surface per level and blitted each frame
+        self.board = pygame.Surface((self.grid_width * self.cell_size,
+                                     self.grid_height * self.cell_size))
+        
         # Game state
         self.clock = pygame.time.Clock()
         self.running = True
@@ -166,6 +263,7 @@ class SimpleFrogger:
         self.player = Player(self.grid_width // 2, self.grid_height - 1)
         self.lanes: List[Lane] = []
         self.game_objects: List[GameObject] = []
+        self.obstacles = ObstacleArrays(self.grid_width)
         
         # Game stats
         self.lives = 3
@@ -174,12 +272,22 @@ class SimpleFrogger:
         self.game_over = False
         self.won = False
         
+        # KEYDOWN dispatch: key -> (handler, argument), one dict lookup per press
+        self.key_bindings = {pygame.K_r: (self.reset_game, None)}
+        for keys, direction in (((pygame.K_w, pygame.K_UP), Direction.UP),
+                                ((pygame.K_s, pygame.K_DOWN), Direction.DOWN),
+                                ((pygame.K_a, pygame.K_LEFT), Direction.LEFT),
+                                ((pygame.K_d, pygame.K_RIGHT), Direction.RIGHT)):
+            for key in keys:
+                self.key_bindings[key] = (self.move_player, direction)
+        
         self.setup_lanes()
     
     def setup_lanes(self):
         """Setup the lanes for the Frogger game."""
         self.lanes.clear()
         self.game_objects.clear()
+        self.obstacles.clear()
         
         # Bottom safe zone (spawn)
         self.lanes.append(Lane(self.grid_height - 1, LaneType.SAFE))
@@ -198,7 +306,7 @@ class SimpleFrogger:
             for i in range(car_count):
                 x = random.randint(0, self.grid_width - 1)
                 color = random.choice([1, 2, 5])  # Blue, red, gray for cars
-                car = MovingObstacle(x, y, color, speed, direction, width=2)
+                car = self.obstacles.add(x, y, color, speed, direction, width=2)
                 lane.add_obstacle(car)
                 self.game_objects.append(car)
             
@@ -222,7 +330,7 @@ class SimpleFrogger:
             for i in range(log_count):
                 x = random.randint(0, self.grid_width - 3)
                 color = 7  # Orange for logs
-                log = MovingObstacle(x, y, color, speed, direction, width=3)
+                log = self.obstacles.add(x, y, color, speed, direction, width=3)
                 lane.add_obstacle(log)
                 self.game_objects.append(log)
             
@@ -231,19 +339,42 @@ class SimpleFrogger:
         # Top goal zone
         for y in range(0, 2):
             self.lanes.append(Lane(y, LaneType.GOAL))
+        
+        self.render_board()
+    
+    def get_lane_color(self, lane: Lane) -> Tuple[int, int, int]:
+        """Get the background color for a lane."""
+        if lane.lane_type == LaneType.ROAD:
+            return (64, 64, 64)  # Dark gray for road
+        elif lane.lane_type == LaneType.WATER:
+            return ARC_COLORS[1]  # Blue for water
+        elif lane.lane_type == LaneType.GOAL:
+            return ARC_COLORS[3]  # Green for goal
+        else:
+            return (100, 200, 100)  # Light green for safe
+    
+    def render_board(self):
+        """Composite the lane backgrounds and grid lines into the board surface."""
+        cs = self.cell_size
+        lane_colors = np.array([self.get_lane_color(self.get_lane_at(y))
+                                for y in range(self.grid_height)], dtype=np.uint8)
+        pixels = np.empty((self.grid_width * cs, self.grid_height * cs, 3), dtype=np.uint8)
+        pixels[:] = lane_colors.repeat(cs, axis=0)[None, :, :]
+        
+        # Grid lines run along every cell's top and left pixel row/column
+        pixels[::cs, :] = (200, 200, 200)
+        pixels[:, ::cs] = (200, 200, 200)
+        pygame.surfarray.blit_array(self.board, pixels)
     
     def update(self, dt: float):
         """Update game state."""
         if self.game_over or self.won:
             return
         
-        # Update lanes
-        for lane in self.lanes:
-            lane.update(dt)
-        
-        # Update all game objects
-        for obj in self.game_objects:
-            obj.update(dt)
+        # Step every obstacle as one array update. The lane pass and the
+        # game-object pass each used to step every obstacle, so keep both.
+        self.obstacles.update(dt)
+        self.obstacles.update(dt)
         
         # Update player
         self.player.update(dt)
@@ -271,15 +402,19 @@ class SimpleFrogger:
         """Check for collisions between player and obstacles."""
         player_lane = self.get_lane_at(self.player.y)
         
+        # Lane obstacles share the player's row, so the 1x1 player overlaps
+        # one exactly when its x falls inside the obstacle's span
+        px = self.player.x
+        
         if player_lane.lane_type == LaneType.WATER:
             # In water - must be on a log to survive
             on_log = False
             for obstacle in player_lane.obstacles:
-                if self.objects_collide(obstacle, self.player):
+                if obstacle.x <= px < obstacle.x + obstacle.width:
                     on_log = True
                     # If just stepped on log, calculate offset
                     if not self.player.on_log or self.player.current_log != obstacle:
-                        self.player.log_offset = self.player.x - obstacle.x
+                        self.player.log_offset = px - obstacle.x
                     self.player.on_log = True
                     self.player.current_log = obstacle
                     break
@@ -293,7 +428,7 @@ class SimpleFrogger:
         elif player_lane.lane_type == LaneType.ROAD:
             # On road - collision with car kills player
             for obstacle in player_lane.obstacles:
-                if self.objects_collide(obstacle, self.player):
+                if obstacle.x <= px < obstacle.x + obstacle.width:
                     self.player_dies()
                     break
         
@@ -303,13 +438,6 @@ class SimpleFrogger:
             self.player.current_log = None
             self.player.log_offset = 0
     
-    def objects_collide(self, obj1: GameObject, obj2: GameObject) -> bool:
-        """Check if two objects collide."""
-        return (obj1.x < obj2.x + obj2.width and
-                obj1.x + obj1.width > obj2.x and
-                obj1.y < obj2.y + obj2.height and
-                obj1.y + obj1.height > obj2.y)
-    
     def get_lane_at(self, y: int) -> Lane:
         """Get the lane at the given y coordinate."""
         for lane in self.lanes:
@@ -346,50 +474,29 @@ class SimpleFrogger:
         self.setup_lanes()
     
     def draw_grid(self):
-        """Draw the game grid."""
-        # Draw background based on lane type
-        for y in range(self.grid_height):
-            lane = self.get_lane_at(y)
-            
-            # Lane background color
-            if lane.lane_type == LaneType.ROAD:
-                bg_color = (64, 64, 64)  # Dark gray for road
-            elif lane.lane_type == LaneType.WATER:
-                bg_color = ARC_COLORS[1]  # Blue for water
-            elif lane.lane_type == LaneType.GOAL:
-                bg_color = ARC_COLORS[3]  # Green for goal
-            else:
-                bg_color = (100, 200, 100)  # Light green for safe
-            
-            # Draw lane background
-            lane_rect = pygame.Rect(0, y * self.cell_size, 
-                                  self.grid_width * self.cell_size, self.cell_size)
-            pygame.draw.rect(self.screen, bg_color, lane_rect)
-        
-        # Draw grid lines
-        for x in range(self.grid_width + 1):
-            pygame.draw.line(self.screen, (200, 200, 200), 
-                           (x * self.cell_size, 0), 
-                           (x * self.cell_size, self.grid_height * self.cell_size))
-        
-        for y in range(self.grid_height + 1):
-            pygame.draw.line(self.screen, (200, 200, 200), 
-                           (0, y * self.cell_size), 
-                           (self.grid_width * self.cell_size, y * self.cell_size))
+        """Draw the lanes, grid lines and obstacles."""
+        cs = self.cell_size
+        screen = self.screen
+        screen.blit(self.board, (0, 0))
+        
+        # Closing right and bottom grid lines, just outside the board
+        board_width = self.grid_width * cs
+        board_height = self.grid_height * cs
+        pygame.draw.line(screen, (200, 200, 200), (board_width, 0), (board_width, board_height))
+        pygame.draw.line(screen, (200, 200, 200), (0, board_height), (board_width, board_height))
+        
+        # Obstacles cover the grid lines
+        obstacles = self.obstacles
+        n = obstacles.count
+        for x, y, width, color in zip(obstacles.x[:n].tolist(), obstacles.y[:n].tolist(),
+                                      obstacles.width[:n].tolist(), obstacles.color[:n].tolist()):
+            pygame.draw.rect(screen, ARC_COLORS.get(color, (255, 255, 255)),
+                             (x * cs, y * cs, width * cs, cs))
     
     def draw_objects(self):
-        """Draw all game objects."""
-        # Draw obstacles
-        for obj in self.game_objects:
-            color = ARC_COLORS.get(obj.color, (255, 255, 255))
-            rect = pygame.Rect(obj.x * self.cell_size, obj.y * self.cell_size, 
-                             obj.width * self.cell_size, self.cell_size)
-            pygame.draw.rect(self.screen, color, rect)
-        
-        # Draw player
+        """Draw the player on top of the board."""
         player_color = ARC_COLORS.get(self.player.color, (0, 255, 0))
-        player_rect = pygame.Rect(self.player.x * self.cell_size, self.player.y * self.cell_size, 
-                                self.cell_size, self.cell_size)
+        player_rect = self.cell_rects[self.player.y][self.player.x]
         pygame.draw.rect(self.screen, player_color, player_rect)
         pygame.draw.rect(self.screen, (0, 0, 0), player_rect, 2)  # Black border
     
@@ -438,16 +545,14 @@ class SimpleFrogger:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
-                elif event.key == pygame.K_r:
-                    self.reset_game()
-                elif event.key == pygame.K_w or event.key == pygame.K_UP:
-                    self.move_player(Direction.UP)
-                elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                    self.move_player(Direction.DOWN)
-                elif event.key == pygame.K_a or event.key == pygame.K_LEFT:
-                    self.move_player(Direction.LEFT)
-                elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
-                    self.move_player(Direction.RIGHT)
+                else:
+                    binding = self.key_bindings.get(event.key)
+                    if binding:
+                        handler, arg = binding
+                        if arg is None:
+                            handler()
+                        else:
+                            handler(arg)
     
     def run(self):
         """Main game loop."""
@@ -5,15 +5,199 @@ Includes operations for resizing, cloning, and flood filling.
 """
 
 from typing import List, Optional, Tuple
-import copy
+import threading
+
+import numpy as np
+
+# Valid cell colors, for O(1) membership checks
+_GRID_COLORS = frozenset(range(10))
+
+# Below this many cells the JIT dispatch costs more than the Python loop saves
+_JIT_MIN_CELLS = 64
+
+
+def _flood_kernel(cells, x, y, new_color):
+    """Scanline flood fill of ``cells`` in place from (x, y).
+
+    Written as plain loops over a preallocated int16 seed stack so numba can
+    compile it. A cell can be seeded at most once from each neighboring row,
+    so 2 * height * width slots always suffice. The caller must ensure the
+    start color differs from ``new_color``.
+    """
+    height, width = cells.shape
+    old_color = cells[y, x]
+    stack = np.empty((2 * height * width, 2), dtype=np.int16)
+    stack[0, 0] = x
+    stack[0, 1] = y
+    top = 1
+    while top > 0:
+        top -= 1
+        cx = stack[top, 0]
+        cy = stack[top, 1]
+        if cells[cy, cx] != old_color:
+            continue
+        
+        # Grow the run left and right, then paint it
+        left = cx
+        while left > 0 and cells[cy, left - 1] == old_color:
+            left -= 1
+        right = cx
+        while right < width - 1 and cells[cy, right + 1] == old_color:
+            right += 1
+        for i in range(left, right + 1):
+            cells[cy, i] = new_color
+        
+        # Seed the start of every matching run in the rows above and below
+        for ny in (cy - 1, cy + 1):
+            if ny < 0 or ny >= height:
+                continue
+            in_run = False
+            for i in range(left, right + 1):
+                if cells[ny, i] == old_color:
+                    if not in_run:
+                        stack[top, 0] = i
+                        stack[top, 1] = ny
+                        top += 1
+                        in_run = True
+                else:
+                    in_run = False
+
+
+# numba is optional and slow to import, so the JIT kernel is built on first use
+_jit_flood_kernel = None
+_jit_checked = False
+_jit_lock = threading.Lock()
+
+
+def _get_jit_flood_kernel():
+    """Return the numba-compiled flood kernel, or None if numba isn't installed."""
+    global _jit_flood_kernel, _jit_checked
+    with _jit_lock:
+        if not _jit_checked:
+            try:
+                from numba import njit
+                _jit_flood_kernel = njit(cache=True, boundscheck=False)(_flood_kernel)
+            except ImportError:
+                _jit_flood_kernel = None
+            _jit_checked = True
+    return _jit_flood_kernel
+
+
+# scipy is optional too; its connected-component labeling runs in C
+_ndimage = None
+_ndimage_checked = False
+_FOUR_CONNECTED = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool)
+
+
+def _get_ndimage():
+    """Return scipy.ndimage, or None if scipy isn't installed."""
+    global _ndimage, _ndimage_checked
+    if not _ndimage_checked:
+        try:
+            from scipy import ndimage
+            _ndimage = ndimage
+        except ImportError:
+            _ndimage = None
+        _ndimage_checked = True
+    return _ndimage
+
+
+def warm_up_kernels() -> None:
+    """Import numba and compile the flood kernel ahead of the first fill.
+    
+    Safe to call from a background thread; does nothing without numba.
+    """
+    kernel = _get_jit_flood_kernel()
+    if kernel is not None:
+        kernel(np.zeros((2, 2), dtype=np.uint8), 0, 0, 1)
+
+
+def _label_components(cells: np.ndarray) -> np.ndarray:
+    """Label 4-connected same-color regions.
+    
+    Uses scipy.ndimage.label when scipy is installed, otherwise a two-pass
+    union-find with path halving.
+    
+    Args:
+        cells: (height, width) color array
+        
+    Returns:
+        int16 array of the same shape where cells share a label exactly when
+        they belong to the same region
+    """
+    ndimage = _get_ndimage()
+    if ndimage is not None:
+        # Label each color's mask in C and offset the labels so they stay unique
+        labels = np.zeros(cells.shape, dtype=np.int16)
+        offset = 0
+        for color in np.unique(cells):
+            color_labels, count = ndimage.label(cells == color, structure=_FOUR_CONNECTED)
+            inside = color_labels > 0
+            labels[inside] = color_labels[inside] + offset
+            offset += count
+        return labels
+    
+    height, width = cells.shape
+    rows = cells.tolist()
+    parent = list(range(height * width))
+    
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
+    
+    # First pass: union each cell with matching left and upper neighbors
+    for y in range(height):
+        row = rows[y]
+        above = rows[y - 1] if y > 0 else None
+        base = y * width
+        for x in range(width):
+            value = row[x]
+            if x > 0 and row[x - 1] == value:
+                a, b = find(base + x), find(base + x - 1)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+            if above is not None and above[x] == value:
+                a, b = find(base + x), find(base + x - width)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+    
+    # Second pass: resolve every cell to its root
+    labels = [find(i) for i in range(height * width)]
+    return np.array(labels, dtype=np.int16).reshape(height, width)
+
+
+# Nibble masks for 16 cells packed into one uint64 word
+_NIBBLE_ONES = 0x1111111111111111
+_NIBBLE_LOW3 = 0x7777777777777777
+_NIBBLE_HIGH = 0x8888888888888888
+_NIBBLE_SHIFTS = np.arange(16, dtype=np.uint64) * np.uint64(4)
+
+
+def _pack_nibbles(cells: np.ndarray) -> np.ndarray:
+    """Pack a (height, width) color array into 4-bit nibbles, 16 per uint64.
+    
+    Cell x of a row lives in word x // 16 at bit offset (x % 16) * 4. Padding
+    nibbles past the row end hold 0xF, which is never a valid color.
+    """
+    height, width = cells.shape
+    words = (width + 15) // 16
+    padded = np.full((height, words * 16), 0xF, dtype=np.uint64)
+    padded[:, :width] = cells
+    nibbles = padded.reshape(height, words, 16) << _NIBBLE_SHIFTS
+    return np.bitwise_or.reduce(nibbles, axis=2)
 
 
 class Grid:
     """A 2D grid of integers representing colors (0-9).
     
     Default size is 8×8, maximum size is 64×64 for extended editor use.
+    Cells are stored in a contiguous NumPy uint8 array indexed [y, x].
     """
     
+    MAX_DIM = 64
+    
     def __init__(self, width: int = 8, height: int = 8, default_value: int = 0):
         """Initialize a new grid.
         
@@ -24,14 +208,17 @@ class Grid:
         """
         if width <= 0 or height <= 0:
             raise ValueError("Grid dimensions must be positive")
-        if width > 64 or height > 64:
-            raise ValueError("Grid dimensions cannot exceed 64×64")
+        if width > self.MAX_DIM or height > self.MAX_DIM:
+            raise ValueError(f"Grid dimensions cannot exceed {self.MAX_DIM}×{self.MAX_DIM}")
         if not (0 <= default_value <= 9):
             raise ValueError("Grid values must be between 0-9")
             
         self.width = width
         self.height = height
-        self.cells = [[default_value for _ in range(width)] for _ in range(height)]
+        self.cells = np.full((height, width), default_value, dtype=np.uint8)
+        self._snapshot: Optional[bytes] = None  # Cached cell bytes, dropped on mutation
+        self._labels: Optional[np.ndarray] = None  # Cached region labels, dropped on mutation
+        self._packed: Optional[np.ndarray] = None  # Cached nibble-packed cells, dropped on mutation
     
     def get(self, x: int, y: int) -> int:
         """Get the value at position (x, y).
@@ -46,9 +233,9 @@ class Grid:
         Raises:
             IndexError: If coordinates are out of bounds
         """
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            raise IndexError(f"Coordinates ({x}, {y}) out of bounds for {self.width}×{self.height} grid")
-        return self.cells[y][x]
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells.item(y, x)
+        raise IndexError(f"Coordinates ({x}, {y}) out of bounds for {self.width}×{self.height} grid")
     
     def set(self, x: int, y: int, value: int) -> None:
         """Set the value at position (x, y).
@@ -62,11 +249,14 @@ class Grid:
             IndexError: If coordinates are out of bounds
             ValueError: If value is not in range 0-9
         """
+        # Common case first; work out which check failed only when raising
+        if 0 <= x < self.width and 0 <= y < self.height and value in _GRID_COLORS:
+            self.cells[y, x] = value
+            self._invalidate()
+            return
         if not (0 <= x < self.width and 0 <= y < self.height):
             raise IndexError(f"Coordinates ({x}, {y}) out of bounds for {self.width}×{self.height} grid")
-        if not (0 <= value <= 9):
-            raise ValueError(f"Value {value} must be between 0-9")
-        self.cells[y][x] = value
+        raise ValueError(f"Value {value} must be between 0-9")
     
     def resize(self, width: int, height: int, default_value: int = 0) -> None:
         """Resize the grid, preserving existing data where possible.
@@ -78,22 +268,28 @@ class Grid:
         """
         if width <= 0 or height <= 0:
             raise ValueError("Grid dimensions must be positive")
-        if width > 64 or height > 64:
-            raise ValueError("Grid dimensions cannot exceed 64×64")
+        if width > self.MAX_DIM or height > self.MAX_DIM:
+            raise ValueError(f"Grid dimensions cannot exceed {self.MAX_DIM}×{self.MAX_DIM}")
         if not (0 <= default_value <= 9):
             raise ValueError("Default value must be between 0-9")
         
         # Create new grid with default values
-        new_cells = [[default_value for _ in range(width)] for _ in range(height)]
+        new_cells = np.full((height, width), default_value, dtype=np.uint8)
         
         # Copy existing data
-        for y in range(min(height, self.height)):
-            for x in range(min(width, self.width)):
-                new_cells[y][x] = self.cells[y][x]
+        keep_h = min(height, self.height)
+        keep_w = min(width, self.width)
+        new_cells[:keep_h, :keep_w] = self.cells[:keep_h, :keep_w]
         
         self.width = width
         self.height = height
         self.cells = new_cells
+        self._invalidate()
+    
+    def clear(self) -> None:
+        """Reset every cell to 0 (black)."""
+        self.cells.fill(0)
+        self._invalidate()
     
     def clone(self) -> 'Grid':
         """Create a deep copy of this grid.
@@ -101,9 +297,19 @@ class Grid:
         Returns:
             A new Grid instance with the same data
         """
-        new_grid = Grid(self.width, self.height)
-        new_grid.cells = copy.deepcopy(self.cells)
-        return new_grid
+        return self._new_unchecked(self.cells.copy())
+    
+    @classmethod
+    def _new_unchecked(cls, cells: np.ndarray) -> 'Grid':
+        """Wrap an already-valid uint8 cell array without re-validating it.
+        
+        For internal callers only; the public constructors keep their checks.
+        """
+        grid = cls.__new__(cls)
+        grid.height, grid.width = cells.shape
+        grid.cells = cells
+        grid._invalidate()
+        return grid
     
     def flood_fill(self, x: int, y: int, new_color: int) -> None:
         """Fill a contiguous area of the same color with a new color.
@@ -122,26 +328,53 @@ class Grid:
         if original_color == new_color:
             return  # No change needed
         
-        # Use iterative flood fill to avoid recursion depth issues
+        # A preview already labeled the regions, so fill by mask
+        if self._labels is not None:
+            self.cells[self._labels == self._labels[y, x]] = new_color
+            self._invalidate()
+            return
+        
+        if self.width * self.height >= _JIT_MIN_CELLS:
+            kernel = _get_jit_flood_kernel()
+            if kernel is not None:
+                kernel(self.cells, x, y, new_color)
+                self._invalidate()
+                return
+            
+            # Without numba, label the original color's regions in C
+            ndimage = _get_ndimage()
+            if ndimage is not None:
+                labels, _ = ndimage.label(self.cells == original_color, structure=_FOUR_CONNECTED)
+                self.cells[labels == labels[y, x]] = new_color
+                self._invalidate()
+                return
+        
+        # Scanline fill: paint whole horizontal runs at once. Painted cells no
+        # longer match the original color, so no visited set is needed.
+        cells = self.cells
         stack = [(x, y)]
-        visited = set()
         
         while stack:
             cx, cy = stack.pop()
+            row = cells[cy]
+            if row[cx] != original_color:
+                continue  # Already painted via another seed
             
-            if (cx, cy) in visited:
-                continue
-            if not (0 <= cx < self.width and 0 <= cy < self.height):
-                continue
-            if self.get(cx, cy) != original_color:
-                continue
+            # Extend to the maximal run of the original color around cx
+            before = np.flatnonzero(row[:cx] != original_color)
+            after = np.flatnonzero(row[cx + 1:] != original_color)
+            left = int(before[-1]) + 1 if before.size else 0
+            right = cx + int(after[0]) if after.size else self.width - 1
+            row[left:right + 1] = new_color
             
-            visited.add((cx, cy))
-            self.set(cx, cy, new_color)
-            
-            # Add neighbors to stack
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                stack.append((cx + dx, cy + dy))
+            # Seed one point per run of the original color just above and below
+            for ny in (cy - 1, cy + 1):
+                if 0 <= ny < self.height:
+                    span = (cells[ny, left:right + 1] == original_color).view(np.int8)
+                    for start in np.flatnonzero(np.diff(span, prepend=0) == 1):
+                        stack.append((left + int(start), ny))
+        
+        self._invalidate()
     
     def to_list(self) -> List[List[int]]:
         """Convert grid to a list of lists format.
@@ -149,7 +382,7 @@ class Grid:
         Returns:
             Grid data as a list of lists
         """
-        return copy.deepcopy(self.cells)
+        return self.cells.tolist()
     
     def from_list(self, data: List[List[int]]) -> None:
         """Load grid data from a list of lists.
@@ -164,23 +397,125 @@ class Grid:
         width = len(data[0])
         
         # Validate dimensions
-        if width > 64 or height > 64:
-            raise ValueError("Grid dimensions cannot exceed 64×64")
+        if width > self.MAX_DIM or height > self.MAX_DIM:
+            raise ValueError(f"Grid dimensions cannot exceed {self.MAX_DIM}×{self.MAX_DIM}")
         
         # Validate all rows have same length
         for row in data:
             if len(row) != width:
                 raise ValueError("All rows must have the same length")
         
-        # Validate all values are in range 0-9
-        for row in data:
-            for val in row:
-                if not (0 <= val <= 9):
-                    raise ValueError(f"All values must be between 0-9, got {val}")
+        # Validate all values are in range 0-9. An integer array within range
+        # passes with two reductions; anything else falls through to the
+        # per-cell scan, which reports the offending value.
+        cells = np.asarray(data)
+        if not (cells.ndim == 2 and cells.dtype.kind in 'iu'
+                and cells.min() >= 0 and cells.max() <= 9):
+            for row in data:
+                for val in row:
+                    if val not in _GRID_COLORS:
+                        raise ValueError(f"All values must be between 0-9, got {val}")
         
         self.width = width
         self.height = height
-        self.cells = copy.deepcopy(data)
+        self.cells = np.ascontiguousarray(cells, dtype=np.uint8)
+        self._invalidate()
+    
+    def _invalidate(self) -> None:
+        """Drop caches derived from the cells after a mutation."""
+        self._snapshot = None
+        self._labels = None
+        self._packed = None
+    
+    def region_mask(self, x: int, y: int) -> np.ndarray:
+        """Return the contiguous same-color region containing (x, y).
+        
+        Region labels for the whole grid are computed once and reused until
+        the next mutation, so repeated queries (e.g. a fill preview followed
+        by the fill itself) don't re-walk the grid.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            
+        Returns:
+            Boolean (height, width) mask of the region
+            
+        Raises:
+            IndexError: If coordinates are out of bounds
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Coordinates ({x}, {y}) out of bounds for {self.width}×{self.height} grid")
+        if self._labels is None:
+            self._labels = _label_components(self.cells)
+        return self._labels == self._labels[y, x]
+    
+    def packed(self) -> np.ndarray:
+        """Return the cells packed as 4-bit nibbles, 16 per uint64 word.
+        
+        The packed form is an eighth the size of the uint8 cells and is
+        cached until the next mutation.
+        
+        Returns:
+            (height, ceil(width / 16)) uint64 array
+        """
+        if self._packed is None:
+            self._packed = _pack_nibbles(self.cells)
+        return self._packed
+    
+    def count_color(self, color: int) -> int:
+        """Count the cells of a given color.
+        
+        Works on the packed words with SWAR: XOR against the color repeated
+        in every nibble turns matching cells into zero nibbles, which are
+        flagged in each nibble's high bit and popcounted 16 cells at a time.
+        
+        Args:
+            color: Color to count (0-9)
+            
+        Returns:
+            Number of cells with that color
+        """
+        if not (0 <= color <= 9):
+            raise ValueError(f"Color {color} must be between 0-9")
+        
+        words = self.packed() ^ np.uint64(color * _NIBBLE_ONES)
+        # High bit of each nibble is set iff the nibble is non-zero
+        nonzero = ((words & np.uint64(_NIBBLE_LOW3)) + np.uint64(_NIBBLE_LOW3)) | words
+        zero_flags = ~nonzero & np.uint64(_NIBBLE_HIGH)
+        return int(np.bitwise_count(zero_flags).sum())
+    
+    def count_by_color(self) -> np.ndarray:
+        """Count the cells of every color in one pass.
+        
+        Returns:
+            Length-10 array where entry c is the number of cells with color c
+        """
+        return np.bincount(self.cells.ravel(), minlength=10)
+    
+    def find_color(self, color: int) -> np.ndarray:
+        """Find every cell of a given color.
+        
+        Args:
+            color: Color to look for (0-9)
+            
+        Returns:
+            (n, 2) array of (y, x) coordinates, in row-major order
+        """
+        return np.argwhere(self.cells == color)
+    
+    def snapshot(self) -> bytes:
+        """Return the cell values as immutable bytes in row-major order.
+        
+        The bytes are cached until the next mutation, so repeated calls on an
+        unchanged grid are free. Use it for change detection and undo history.
+        
+        Returns:
+            The grid's cells as width * height bytes
+        """
+        if self._snapshot is None:
+            self._snapshot = self.cells.tobytes()
+        return self._snapshot
     
     def __str__(self) -> str:
         """String representation of the grid."""
@@ -7,6 +7,33 @@ import json
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+import numpy as np
+
+
+# Task files are read and written whole, so use one large buffer
+_IO_BUFFER_SIZE = 1 << 20
+
+# Grid validation limits for ARC-AGI-3 task files
+_VALID_COLORS = frozenset(range(16))
+_MAX_GRID_DIM = 30
+
+# orjson is optional and only imported on the first load or save
+_orjson = None
+_orjson_checked = False
+
+
+def _get_orjson():
+    """Return the orjson module, or None if it isn't installed."""
+    global _orjson, _orjson_checked
+    if not _orjson_checked:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = None
+        _orjson_checked = True
+    return _orjson
+
 # ARC-AGI-3 OFFICIAL 16-COLOR PALETTE
 # Updated October 2025 for full ARC-AGI-3 compliance
 ARC_COLORS = {
@@ -54,6 +81,15 @@ ARC_COLOR_CODES = {
     15: "#A0DCFF"   # Light Blue
 }
 
+# RGB and hex values indexed by color, so lookups skip dict hashing
+_ARC_RGB = tuple(ARC_COLORS[i] for i in range(16))
+_ARC_HEX = tuple(ARC_COLOR_CODES[i] for i in range(16))
+
+# (16, 3) uint8 RGB lookup table; palette[grid] maps a whole grid to pixels.
+# Shared by every importer, so it is read-only.
+ARC_PALETTE = np.array(_ARC_RGB, dtype=np.uint8)
+ARC_PALETTE.setflags(write=False)
+
 
 def load_arc_task(file_path: str) -> Dict[str, Any]:
     """Load an ARC task from JSON file.
@@ -69,12 +105,15 @@ def load_arc_task(file_path: str) -> Dict[str, Any]:
         json.JSONDecodeError: If the file contains invalid JSON
         ValueError: If the task format is invalid
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
-    with open(path, 'r') as f:
-        data = json.load(f)
+    # Read the whole file in one call and parse from memory. Opening directly
+    # (rather than checking exists() first) saves a stat per load.
+    try:
+        with open(file_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    orjson = _get_orjson()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     # Validate basic structure
     if not isinstance(data, dict):
@@ -133,13 +172,21 @@ def save_arc_task(task_data: Dict[str, Any], file_path: str) -> None:
     if 'train' not in task_data:
         raise ValueError("Task data must contain 'train' key")
     
-    # Create directory if it doesn't exist
-    path = Path(file_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    # Serialize with proper formatting, then write in a single call
+    orjson = _get_orjson()
+    if orjson is not None:
+        buf = orjson.dumps(task_data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(task_data, indent=2, separators=(',', ': ')).encode('utf-8')
     
-    # Save with proper formatting
-    with open(path, 'w') as f:
-        json.dump(task_data, f, indent=2, separators=(',', ': '))
+    try:
+        f = open(file_path, 'wb', buffering=_IO_BUFFER_SIZE)
+    except FileNotFoundError:
+        # Create the directory only when it is actually missing
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        f = open(file_path, 'wb', buffering=_IO_BUFFER_SIZE)
+    with f:
+        f.write(buf)
 
 
 def _validate_grid_data(grid_data: List[List[int]], context: str) -> None:
@@ -168,7 +215,7 @@ def _validate_grid_data(grid_data: List[List[int]], context: str) -> None:
     height = len(grid_data)
     width = len(grid_data[0])
     
-    if height > 30 or width > 30:
+    if height > _MAX_GRID_DIM or width > _MAX_GRID_DIM:
         raise ValueError(f"{context} dimensions cannot exceed 30×30")
     
     # Check all rows have same length
@@ -176,10 +223,20 @@ def _validate_grid_data(grid_data: List[List[int]], context: str) -> None:
         if len(row) != width:
             raise ValueError(f"{context} row {i} has different length than first row")
     
-    # Check all values are valid colors (0-15 for ARC-AGI-3)
+    # Check all values are valid colors (0-15 for ARC-AGI-3). An integer
+    # array within range passes with two reductions; anything else falls
+    # through to the per-cell scan, which pinpoints the offending value.
+    try:
+        cells = np.asarray(grid_data)
+    except (ValueError, TypeError):
+        cells = None  # Nested or ragged cells; let the scan report them
+    if (cells is not None and cells.ndim == 2 and cells.dtype.kind in 'iu'
+            and cells.min() >= 0 and cells.max() <= 15):
+        return
+    
     for i, row in enumerate(grid_data):
         for j, value in enumerate(row):
-            if not isinstance(value, int) or not (0 <= value <= 15):
+            if not isinstance(value, int) or value not in _VALID_COLORS:
                 raise ValueError(f"{context} contains invalid value {value} at position ({j}, {i})")
 
 
@@ -251,7 +308,7 @@ def get_color_rgb(color_index: int) -> tuple:
     if not (0 <= color_index <= 15):
         raise ValueError(f"Color index {color_index} must be between 0-15")
 
-    return ARC_COLORS[color_index]
+    return _ARC_RGB[color_index]
 
 
 def get_color_hex(color_index: int) -> str:
@@ -269,4 +326,4 @@ def get_color_hex(color_index: int) -> str:
     if not (0 <= color_index <= 15):
         raise ValueError(f"Color index {color_index} must be between 0-15")
 
-    return ARC_COLOR_CODES[color_index]
\ No newline at end of file
+    return _ARC_HEX[color_index]
\ No newline at end of file
@@ -16,19 +16,33 @@ Features:
 import sys
 import os
 import json
+import hashlib
+import threading
 import pygame
 import numpy as np
 import math
+from functools import partial
 from typing import Dict, List, Tuple, Optional, Any
 
 # Add our existing modules to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
-from arc_agi_editor.editor.grid_model import Grid
-from arc_agi_editor.editor.utils import get_color_hex, ARC_COLOR_CODES, ARC_COLORS
+from arc_agi_editor.editor.grid_model import Grid, warm_up_kernels
+from arc_agi_editor.editor.utils import get_color_hex, ARC_COLOR_CODES, ARC_COLORS, ARC_PALETTE
+
+# Palette swatch (row, column) for each color: two columns of eight
+PALETTE_LAYOUT = tuple((i % 8, i // 8) for i in range(16))
 
 class UIElement:
     """Base class for UI elements."""
+    _font = None  # Shared by every widget; loaded on first use
+    
+    @classmethod
+    def shared_font(cls) -> pygame.font.Font:
+        if UIElement._font is None:
+            UIElement._font = pygame.font.Font(None, 24)
+        return UIElement._font
+    
     def __init__(self, x: int, y: int, width: int, height: int):
         self.rect = pygame.Rect(x, y, width, height)
         self.visible = True
@@ -52,8 +66,20 @@ class Button(UIElement):
         self.callback = callback
         self.color = color
         self.text_color = text_color
-        self.font = pygame.font.Font(None, 24)
+        self.font = self.shared_font()
         self.pressed = False
+        
+        # Label is rendered once and reused until the text changes
+        self.label_text = None
+        self.label_surface = None
+        self.label_rect = None
+    
+    def _update_label(self):
+        """Re-render the cached label surface if the text has changed."""
+        if self.text != self.label_text:
+            self.label_text = self.text
+            self.label_surface = self.font.render(self.text, True, self.text_color)
+            self.label_rect = self.label_surface.get_rect(center=self.rect.center)
     
     def draw(self, screen: pygame.Surface):
         if not self.visible:
@@ -71,9 +97,8 @@ class Button(UIElement):
         pygame.draw.rect(screen, (100, 100, 100), self.rect, 2)
         
         # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        self._update_label()
+        screen.blit(self.label_surface, self.label_rect)
     
     def handle_click(self, pos: Tuple[int, int]) -> bool:
         if self.contains_point(pos) and self.enabled:
@@ -91,7 +116,7 @@ class TextInput(UIElement):
     def __init__(self, x: int, y: int, width: int, height: int, initial_value: str = ""):
         super().__init__(x, y, width, height)
         self.text = initial_value
-        self.font = pygame.font.Font(None, 24)
+        self.font = self.shared_font()
         self.active = False
         self.cursor_pos = len(self.text)
         self.cursor_visible = True
@@ -164,7 +189,9 @@ class AdvancedGameEngine:
     """Advanced game engine with full Tkinter editor functionality in Pygame."""
     
     def __init__(self):
-        pygame.init()
+        # Only the display and font modules are used; skip mixer/joystick setup
+        pygame.display.init()
+        pygame.font.init()
         
         # Detect screen resolution and set adaptive window size
         self._detect_screen_resolution()
@@ -189,6 +216,15 @@ class AdvancedGameEngine:
         self.running = True
         self.fps = 60
         
+        # Grid size typed into the size box is applied once typing pauses
+        self.resize_delay_ms = 300
+        self.pending_resize = None
+        self.pending_resize_at = 0
+        
+        # Scroll offset for large grids
+        self.scroll_x = 0
+        self.scroll_y = 0
+        
         # Grid and rendering
         self.grid = Grid(8, 8)
         self.calculate_grid_layout()
@@ -202,6 +238,7 @@ class AdvancedGameEngine:
         # File management
         self.current_file = None
         self.current_file_name = "Untitled"
+        self.mark_saved()
         
         # Fonts
         self.font_large = pygame.font.Font(None, 32)
@@ -210,15 +247,23 @@ class AdvancedGameEngine:
         
         # Use ARC-AGI-3 16-color palette
         self.arc_colors = ARC_COLORS  # Now includes colors 0-15
+        self.palette_lut = ARC_PALETTE
+        
+        # Cached grid image - repainted in one shot, patched per cell on paint
+        self.grid_surface = None
+        self.gridline_surface = None
+        self.gridline_key = None  # (width, height, cell_size) the overlay was drawn for
+        self.grid_surface_dirty = True
+        self.dirty_mask = np.zeros((self.grid.height, self.grid.width), dtype=bool)  # Cells painted since last frame
+        
+        # Rendered info/status text, keyed by the state it displays
+        self.info_text_key = None
+        self.info_text_surfaces = None
         
         # UI Elements
         self.ui_elements = []
         self.setup_ui()
         
-        # Scroll offset for large grids
-        self.scroll_x = 0
-        self.scroll_y = 0
-        
         print("🎨 ARC-AGI-3 Level Editor v2.0 initialized!")
         print(f"✅ 16-color palette loaded (ARC-AGI-3 compliant)")
         print(f"Screen: {self.window_width}x{self.window_height}")
@@ -226,8 +271,7 @@ class AdvancedGameEngine:
     
     def _detect_screen_resolution(self):
         """Detect screen resolution and set adaptive sizes."""
-        # Get screen info
-        pygame.init()
+        # Get screen info (the display is already initialized by __init__)
         display_info = pygame.display.Info()
         screen_width = display_info.current_w
         screen_height = display_info.current_h
@@ -266,13 +310,44 @@ class AdvancedGameEngine:
         optimal_cell_size = min(max_cell_width, max_cell_height, self.base_cell_size)
         
         self.cell_size = max(4, optimal_cell_size)  # Minimum 4px cells
+        # Power-of-two cell sizes map pixels to cells with a shift instead of a division
+        if self.cell_size & (self.cell_size - 1) == 0:
+            self.cell_shift = self.cell_size.bit_length() - 1
+        else:
+            self.cell_shift = None
         
         # Grid position
         self.grid_start_x = self.left_panel_width + 20
         self.grid_start_y = self.top_panel_height + 20
+        self.grid_end_x = self.grid_start_x + self.grid.width * self.cell_size
+        self.grid_end_y = self.grid_start_y + self.grid.height * self.cell_size
+        
+        self.update_scroll_region()
         
         print(f"Grid layout: cell_size={self.cell_size}, pos=({self.grid_start_x}, {self.grid_start_y})")
     
+    def update_scroll_region(self):
+        """Compute the visible slice of the grid and its border from known sizes.
+        
+        Call again whenever the layout or scroll offset changes.
+        """
+        grid_width = self.grid.width * self.cell_size
+        grid_height = self.grid.height * self.cell_size
+        
+        visible_x = max(0, self.scroll_x)
+        visible_y = max(0, self.scroll_y)
+        visible_width = min(grid_width - visible_x, self.window_width - self.grid_start_x)
+        visible_height = min(grid_height - visible_y, self.window_height - self.grid_start_y - self.status_bar_height)
+        
+        self.visible_rect = pygame.Rect(visible_x, visible_y, visible_width, visible_height)
+        self.grid_screen_pos = (self.grid_start_x - self.scroll_x, self.grid_start_y - self.scroll_y)
+        self.border_rect = pygame.Rect(
+            self.grid_start_x - 2 - self.scroll_x,
+            self.grid_start_y - 2 - self.scroll_y,
+            min(grid_width + 4, visible_width + 4),
+            min(grid_height + 4, visible_height + 4)
+        )
+    
     def setup_ui(self):
         """Setup all UI elements with proper spacing."""
         self.ui_elements.clear()
@@ -323,12 +398,12 @@ class AdvancedGameEngine:
         current_y += 25  # Space for title
         
         self.paint_button = Button(panel_x, current_y, 120, 35, "Paint Tool", 
-                                  lambda: self.select_tool("paint"), self.GREEN)
+                                  partial(self.select_tool, "paint"), self.GREEN)
         self.ui_elements.append(self.paint_button)
         
         current_y += 40  # Space between tool buttons
         self.fill_button = Button(panel_x, current_y, 120, 35, "Fill Tool", 
-                                 lambda: self.select_tool("fill"), self.RED)
+                                 partial(self.select_tool, "fill"), self.RED)
         self.ui_elements.append(self.fill_button)
         
         current_y += 40  # Space before clear button
@@ -340,6 +415,32 @@ class AdvancedGameEngine:
         
         # Color palette position
         self.palette_label_y = current_y
+        
+        # Palette swatches and background panels never move, so lay them out once
+        palette_x = 20
+        palette_y = self.palette_label_y + 30
+        color_size = 30
+        self.palette_rects = []
+        for row, col in PALETTE_LAYOUT:
+            self.palette_rects.append(pygame.Rect(palette_x + col * (color_size + 3),
+                                                  palette_y + row * (color_size + 3),
+                                                  color_size, color_size))
+        self.palette_area = self.palette_rects[0].unionall(self.palette_rects)
+        self.palette_surface = None  # Swatches are drawn once, then patched on selection change
+        self.palette_selected = None
+        
+        # Static title and section labels are rendered once here
+        self.static_labels = [
+            (self.font_large.render("ARC INTERACTIVE GAME ENGINE", True, self.BLACK), (self.left_panel_width + 20, 45)),
+            (self.font_medium.render("GRID SIZE", True, self.BLACK), (20, self.size_label_y)),
+            (self.font_medium.render("TOOLS", True, self.BLACK), (20, self.tools_label_y)),
+            (self.font_medium.render("COLOR PALETTE", True, self.BLACK), (20, self.palette_label_y)),
+        ]
+        
+        self.status_y = self.window_height - self.status_bar_height
+        self.left_panel_rect = pygame.Rect(0, 0, self.left_panel_width, self.window_height)
+        self.top_panel_rect = pygame.Rect(0, 0, self.window_width, self.top_panel_height)
+        self.status_panel_rect = pygame.Rect(0, self.status_y, self.window_width, self.status_bar_height)
     
     def get_grid_coordinates(self, mouse_pos: Tuple[int, int]) -> Tuple[Optional[int], Optional[int]]:
         """Convert mouse position to grid coordinates."""
@@ -350,140 +451,148 @@ class AdvancedGameEngine:
         mouse_y += self.scroll_y
         
         # Check if mouse is within grid bounds
-        grid_end_x = self.grid_start_x + (self.grid.width * self.cell_size)
-        grid_end_y = self.grid_start_y + (self.grid.height * self.cell_size)
-        
-        if (self.grid_start_x <= mouse_x < grid_end_x and 
-            self.grid_start_y <= mouse_y < grid_end_y):
+        if (self.grid_start_x <= mouse_x < self.grid_end_x and 
+            self.grid_start_y <= mouse_y < self.grid_end_y):
             
-            grid_x = (mouse_x - self.grid_start_x) // self.cell_size
-            grid_y = (mouse_y - self.grid_start_y) // self.cell_size
+            shift = self.cell_shift
+            if shift is not None:
+                grid_x = (mouse_x - self.grid_start_x) >> shift
+                grid_y = (mouse_y - self.grid_start_y) >> shift
+            else:
+                grid_x = (mouse_x - self.grid_start_x) // self.cell_size
+                grid_y = (mouse_y - self.grid_start_y) // self.cell_size
             
             return grid_x, grid_y
         
         return None, None
     
-    def draw_grid(self):
-        """Render the grid using surfarray for performance."""
+    def render_grid_surface(self):
+        """Repaint the cached grid image from the grid data in one shot."""
         grid_width = self.grid.width * self.cell_size
         grid_height = self.grid.height * self.cell_size
         
-        # Create grid surface
-        grid_surface = pygame.Surface((grid_width, grid_height))
+        if self.grid_surface is None or self.grid_surface.get_size() != (grid_width, grid_height):
+            self.grid_surface = pygame.Surface((grid_width, grid_height))
+        
+        # Same pixel size can still mean a different cell size (30x30 vs 32x32)
+        gridline_key = (self.grid.width, self.grid.height, self.cell_size)
+        if gridline_key != self.gridline_key:
+            self.gridline_key = gridline_key
+            self.gridline_surface = self.render_gridlines(grid_width, grid_height)
         
         # Use surfarray for fast rendering
         try:
-            pixel_array = pygame.surfarray.pixels3d(grid_surface)
-            
-            for y in range(self.grid.height):
-                for x in range(self.grid.width):
-                    color_idx = self.grid.get(x, y)
-                    color_rgb = self.arc_colors.get(color_idx, self.BLACK)
-                    
-                    # Fill cell
-                    start_x = x * self.cell_size
-                    start_y = y * self.cell_size
-                    end_x = start_x + self.cell_size
-                    end_y = start_y + self.cell_size
-                    
-                    pixel_array[start_x:end_x, start_y:end_y] = color_rgb
-                    
-                    # Draw grid lines
-                    if self.cell_size > 8:  # Only draw grid lines for larger cells
-                        # Vertical lines
-                        if x > 0:
-                            pixel_array[start_x:start_x+1, start_y:end_y] = self.GRAY
-                        # Horizontal lines
-                        if y > 0:
-                            pixel_array[start_x:end_x, start_y:start_y+1] = self.GRAY
-            
-            del pixel_array  # Release array
+            # Palette lookup gives (H, W, 3); surfarray wants (W, H, 3)
+            colors = self.palette_lut[self.grid.cells].transpose(1, 0, 2)
+            pixels = np.repeat(np.repeat(colors, self.cell_size, axis=0), self.cell_size, axis=1)
+            pygame.surfarray.blit_array(self.grid_surface, pixels)
         except Exception as e:
             # Fallback to rect drawing if surfarray fails
             for y in range(self.grid.height):
                 for x in range(self.grid.width):
-                    color_idx = self.grid.get(x, y)
-                    color_rgb = self.arc_colors.get(color_idx, self.BLACK)
-                    
-                    cell_rect = pygame.Rect(
-                        x * self.cell_size, y * self.cell_size,
-                        self.cell_size, self.cell_size
-                    )
-                    pygame.draw.rect(grid_surface, color_rgb, cell_rect)
-                    
-                    if self.cell_size > 8:
-                        pygame.draw.rect(grid_surface, self.GRAY, cell_rect, 1)
-        
-        # Calculate visible area
-        visible_x = max(0, self.scroll_x)
-        visible_y = max(0, self.scroll_y)
-        visible_width = min(grid_width - visible_x, self.window_width - self.grid_start_x)
-        visible_height = min(grid_height - visible_y, self.window_height - self.grid_start_y - self.status_bar_height)
+                    self.paint_cell(x, y)
+        
+        self.grid_surface_dirty = False
+        self.dirty_mask.fill(False)
+    
+    def render_gridlines(self, grid_width: int, grid_height: int) -> Optional[pygame.Surface]:
+        """Build the gridline overlay drawn on top of the cells.
+        
+        Cells fill their whole tile, so the lines live on a separate
+        colorkeyed surface that only changes with the layout.
+        """
+        if self.cell_size <= 8:  # Only draw grid lines for larger cells
+            return None
+        
+        overlay = pygame.Surface((grid_width, grid_height))
+        overlay.fill(self.BLACK)
+        for x in range(self.cell_size, grid_width, self.cell_size):
+            overlay.fill(self.GRAY, (x, 0, 1, grid_height))
+        for y in range(self.cell_size, grid_height, self.cell_size):
+            overlay.fill(self.GRAY, (0, y, grid_width, 1))
+        overlay.set_colorkey(self.BLACK, pygame.RLEACCEL)
+        return overlay
+    
+    def flush_dirty_cells(self):
+        """Patch all cells painted since the last frame in one pass."""
+        ys, xs = np.nonzero(self.dirty_mask)
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            self.paint_cell(x, y)
+        self.dirty_mask.fill(False)
+    
+    def paint_cell(self, x: int, y: int):
+        """Patch a single cell of the cached grid image."""
+        cell_rect = pygame.Rect(x * self.cell_size, y * self.cell_size,
+                                self.cell_size, self.cell_size)
+        color_rgb = self.arc_colors.get(self.grid.get(x, y), self.BLACK)
+        self.grid_surface.fill(color_rgb, cell_rect)
+    
+    def draw_grid(self):
+        """Blit the cached grid image, applying pending repaints first."""
+        if self.grid_surface_dirty:
+            self.render_grid_surface()
+        elif self.dirty_mask.any():
+            self.flush_dirty_cells()
         
         # Blit visible portion to screen
-        visible_rect = pygame.Rect(visible_x, visible_y, visible_width, visible_height)
-        self.screen.blit(grid_surface, (self.grid_start_x - self.scroll_x, self.grid_start_y - self.scroll_y), visible_rect)
+        self.screen.blit(self.grid_surface, self.grid_screen_pos, self.visible_rect)
+        if self.gridline_surface is not None:
+            self.screen.blit(self.gridline_surface, self.grid_screen_pos, self.visible_rect)
         
         # Draw border
-        border_rect = pygame.Rect(
-            self.grid_start_x - 2 - self.scroll_x,
-            self.grid_start_y - 2 - self.scroll_y,
-            min(grid_width + 4, visible_width + 4),
-            min(grid_height + 4, visible_height + 4)
-        )
-        pygame.draw.rect(self.screen, self.DARK_GRAY, border_rect, 2)
+        pygame.draw.rect(self.screen, self.DARK_GRAY, self.border_rect, 2)
     
     def draw_color_palette(self):
         """Draw the color selection palette."""
-        palette_x = 20
-        palette_y = self.palette_label_y + 30
-        color_size = 30
-        cols = 2
-        
-        # Title
-        title_text = self.font_medium.render("COLOR PALETTE", True, self.BLACK)
-        self.screen.blit(title_text, (palette_x, self.palette_label_y))
 
-        for i in range(16):
-            row = i % 8
-            col = i // 8
-
-            x = palette_x + col * (color_size + 3)
-            y = palette_y + row * (color_size + 3)
-            
-            color_rgb = self.arc_colors.get(i, self.BLACK)
-            
-            # Draw color square
-            color_rect = pygame.Rect(x, y, color_size, color_size)
-            pygame.draw.rect(self.screen, color_rgb, color_rect)
-            
-            # Highlight selected color
-            if i == self.current_color:
-                pygame.draw.rect(self.screen, self.WHITE, color_rect, 3)
-            else:
-                pygame.draw.rect(self.screen, self.DARK_GRAY, color_rect, 1)
+        if self.palette_surface is None:
+            # Gaps between swatches are keyed out so the panels show through
+            self.palette_surface = pygame.Surface(self.palette_area.size)
+            self.palette_surface.fill((255, 0, 255))
+            self.palette_surface.set_colorkey((255, 0, 255))
+            self.palette_selected = self.current_color
+            for i in range(len(self.palette_rects)):
+                self.draw_palette_swatch(i)
+        elif self.current_color != self.palette_selected:
+            # Only the previously and newly selected swatches change
+            previous = self.palette_selected
+            self.palette_selected = self.current_color
+            self.draw_palette_swatch(previous)
+            self.draw_palette_swatch(self.current_color)
+        
+        self.screen.blit(self.palette_surface, self.palette_area.topleft)
+    
+    def draw_palette_swatch(self, i: int):
+        """Draw one swatch onto the cached palette surface."""
+        color_rect = self.palette_rects[i].move(-self.palette_area.x, -self.palette_area.y)
+        color_rgb = self.arc_colors.get(i, self.BLACK)
+        
+        # Draw color square
+        pygame.draw.rect(self.palette_surface, color_rgb, color_rect)
+        
+        # Highlight selected color
+        if i == self.palette_selected:
+            pygame.draw.rect(self.palette_surface, self.WHITE, color_rect, 3)
+        else:
+            pygame.draw.rect(self.palette_surface, self.DARK_GRAY, color_rect, 1)
     
     def draw_ui(self):
         """Draw all UI elements."""
         # Draw background panels
         # Left panel
-        left_panel = pygame.Rect(0, 0, self.left_panel_width, self.window_height)
-        pygame.draw.rect(self.screen, self.LIGHT_GRAY, left_panel)
+        pygame.draw.rect(self.screen, self.LIGHT_GRAY, self.left_panel_rect)
         pygame.draw.line(self.screen, self.DARK_GRAY, 
                         (self.left_panel_width, 0), (self.left_panel_width, self.window_height), 2)
         
         # Top panel
-        top_panel = pygame.Rect(0, 0, self.window_width, self.top_panel_height)
-        pygame.draw.rect(self.screen, (240, 240, 255), top_panel)
+        pygame.draw.rect(self.screen, (240, 240, 255), self.top_panel_rect)
         pygame.draw.line(self.screen, self.DARK_GRAY, 
                         (0, self.top_panel_height), (self.window_width, self.top_panel_height), 2)
         
         # Status bar
-        status_y = self.window_height - self.status_bar_height
-        status_panel = pygame.Rect(0, status_y, self.window_width, self.status_bar_height)
-        pygame.draw.rect(self.screen, (220, 220, 220), status_panel)
+        pygame.draw.rect(self.screen, (220, 220, 220), self.status_panel_rect)
         pygame.draw.line(self.screen, self.DARK_GRAY, 
-                        (0, status_y), (self.window_width, status_y), 1)
+                        (0, self.status_y), (self.window_width, self.status_y), 1)
         
         # Draw all UI elements
         for element in self.ui_elements:
@@ -497,35 +606,40 @@ class AdvancedGameEngine:
     
     def draw_info_text(self):
         """Draw informational text."""
-        # Title in top panel
-        title_text = self.font_large.render("ARC INTERACTIVE GAME ENGINE", True, self.BLACK)
-        self.screen.blit(title_text, (self.left_panel_width + 20, 45))
+        # Title and section labels never change
+        for label_surface, label_pos in self.static_labels:
+            self.screen.blit(label_surface, label_pos)
         
         # Left panel info - positioned to not overlap with UI elements
         info_x = 20
         info_y = 100
         
+        # State-dependent text is only re-rendered when the state it shows changes
+        unsaved = self.has_unsaved_changes()
+        info_key = (self.current_file_name, unsaved, self.current_tool,
+                    self.grid.width, self.grid.height, self.cell_size, self.current_color)
+        if info_key != self.info_text_key:
+            self.info_text_key = info_key
+            self.info_text_surfaces = self.render_info_text(unsaved)
+        file_text, tool_text, status_surface = self.info_text_surfaces
+        
         # Current file
-        file_text = self.font_small.render(f"File: {self.current_file_name}", True, self.BLACK)
         self.screen.blit(file_text, (info_x, info_y))
         
         # Current status
-        status_text = self.font_small.render(f"Tool: {self.current_tool.title()}", True, self.BLACK)
-        self.screen.blit(status_text, (info_x, info_y + 18))
-        
-        # Grid size label
-        size_text = self.font_medium.render("GRID SIZE", True, self.BLACK)
-        self.screen.blit(size_text, (info_x, self.size_label_y))
-        
-        # Tools label
-        tools_text = self.font_medium.render("TOOLS", True, self.BLACK)
-        self.screen.blit(tools_text, (info_x, self.tools_label_y))
+        self.screen.blit(tool_text, (info_x, info_y + 18))
         
         # Status bar text
-        status_y = self.window_height - self.status_bar_height + 5
+        self.screen.blit(status_surface, (10, self.status_y + 5))
+    
+    def render_info_text(self, unsaved: bool) -> Tuple[pygame.Surface, pygame.Surface, pygame.Surface]:
+        """Render the file label, tool label and status bar text for the current state."""
+        unsaved_marker = "*" if unsaved else ""
+        file_text = self.font_small.render(f"File: {self.current_file_name}{unsaved_marker}", True, self.BLACK)
+        tool_text = self.font_small.render(f"Tool: {self.current_tool.title()}", True, self.BLACK)
         status_text = f"Ready - Grid: {self.grid.width}x{self.grid.height} | Cell size: {self.cell_size}px | Selected: Color {self.current_color}, {self.current_tool.title()} tool"
         status_surface = self.font_small.render(status_text, True, self.BLACK)
-        self.screen.blit(status_surface, (10, status_y))
+        return file_text, tool_text, status_surface
     
     # Tool selection methods
     def select_tool(self, tool: str):
@@ -545,33 +659,32 @@ class AdvancedGameEngine:
     # Grid modification methods
     def resize_grid(self, new_size: int):
         """Resize the grid to new dimensions."""
-        if new_size < 1 or new_size > 64:
-            print(f"❌ Grid size {new_size} out of range (1-64)")
+        if new_size < 1 or new_size > Grid.MAX_DIM:
+            print(f"❌ Grid size {new_size} out of range (1-{Grid.MAX_DIM})")
             return
         
-        old_grid = self.grid
-        self.grid = Grid(new_size, new_size)
-        
-        # Copy existing data
-        for y in range(min(new_size, old_grid.height)):
-            for x in range(min(new_size, old_grid.width)):
-                self.grid.set(x, y, old_grid.get(x, y))
+        # Keeps the overlapping cells with a single slice copy
+        self.grid.resize(new_size, new_size)
         
         # Recalculate layout
         self.calculate_grid_layout()
+        self.dirty_mask = np.zeros((new_size, new_size), dtype=bool)
+        self.grid_surface_dirty = True
         
         print(f"📏 Grid resized to {new_size}x{new_size}")
     
     def increase_grid_size(self):
         """Increase grid size by 1."""
+        self.pending_resize = None  # Buttons override any size still being typed
         current_size = self.grid.width
-        if current_size < 64:
+        if current_size < Grid.MAX_DIM:
             new_size = current_size + 1
             self.resize_grid(new_size)
             self.grid_size_input.text = str(new_size)
     
     def decrease_grid_size(self):
         """Decrease grid size by 1."""
+        self.pending_resize = None  # Buttons override any size still being typed
         current_size = self.grid.width
         if current_size > 1:
             new_size = current_size - 1
@@ -580,17 +693,32 @@ class AdvancedGameEngine:
     
     def clear_grid(self):
         """Clear all grid cells."""
-        for y in range(self.grid.height):
-            for x in range(self.grid.width):
-                self.grid.set(x, y, 0)
+        self.grid.clear()
+        self.grid_surface_dirty = True
         print("🧹 Grid cleared")
     
+    def grid_digest(self) -> bytes:
+        """Hash the grid's size and cells to detect changes cheaply."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(bytes((self.grid.width, self.grid.height)))
+        digest.update(self.grid.snapshot())
+        return digest.digest()
+    
+    def mark_saved(self):
+        """Record the current grid as the saved state."""
+        self.saved_digest = self.grid_digest()
+    
+    def has_unsaved_changes(self) -> bool:
+        """Check whether the grid differs from the last saved state."""
+        return self.grid_digest() != self.saved_digest
+    
     # File operations (placeholder - will implement with proper dialogs)
     def new_file(self):
         """Create a new file."""
         self.current_file = None
         self.current_file_name = "Untitled"
         self.clear_grid()
+        self.mark_saved()
         print("📄 New file created")
     
     def save_file(self):
@@ -614,18 +742,8 @@ class AdvancedGameEngine:
                 return
         
         # Check color palette
-        palette_x = 20
-        palette_y = self.palette_label_y + 30
-        color_size = 30
-
-        for i in range(16):
-            row = i % 8
-            col = i // 8
-
-            x = palette_x + col * (color_size + 3)
-            y = palette_y + row * (color_size + 3)
-
-            if x <= pos[0] <= x + color_size and y <= pos[1] <= y + color_size:
+        for i, rect in enumerate(self.palette_rects):
+            if rect.left <= pos[0] <= rect.right and rect.top <= pos[1] <= rect.bottom:
                 self.current_color = i
                 print(f"🎨 Selected color {i}")
                 return
@@ -639,8 +757,12 @@ class AdvancedGameEngine:
         """Handle clicks on the grid."""
         if self.current_tool == "paint":
             self.grid.set(grid_x, grid_y, self.current_color)
+            self.dirty_mask[grid_y, grid_x] = True
         elif self.current_tool == "fill":
+            before = self.grid.cells.copy()
             self.grid.flood_fill(grid_x, grid_y, self.current_color)
+            # Repaint only the filled region rather than the whole grid
+            self.dirty_mask |= before != self.grid.cells
     
     def handle_drag(self, pos: Tuple[int, int]):
         """Handle mouse drag for paint tool."""
@@ -652,12 +774,16 @@ class AdvancedGameEngine:
             current_cell = (grid_x, grid_y)
             if current_cell != self.last_painted_cell:
                 self.grid.set(grid_x, grid_y, self.current_color)
+                self.dirty_mask[grid_y, grid_x] = True
                 self.last_painted_cell = current_cell
     
     def run(self):
         """Main game loop."""
         print("🚀 Starting advanced game engine...")
         
+        # Compile the fill kernel while the window is already up and usable
+        threading.Thread(target=warm_up_kernels, daemon=True).start()
+        
         while self.running:
             dt = self.clock.tick(self.fps)
             
@@ -693,12 +819,14 @@ class AdvancedGameEngine:
                         if isinstance(element, TextInput):
                             if element.handle_keydown(event):
                                 handled = True
-                                # Update grid size if it was the size input
+                                # Queue a grid resize if it was the size input
                                 if element == self.grid_size_input:
+                                    self.pending_resize = None
                                     try:
                                         new_size = int(element.text)
-                                        if 1 <= new_size <= 64:
-                                            self.resize_grid(new_size)
+                                        if 1 <= new_size <= Grid.MAX_DIM:
+                                            self.pending_resize = new_size
+                                            self.pending_resize_at = pygame.time.get_ticks() + self.resize_delay_ms
                                     except ValueError:
                                         pass
                                 break
@@ -716,6 +844,12 @@ class AdvancedGameEngine:
                         elif event.key == pygame.K_ESCAPE:
                             self.running = False
             
+            # Apply a typed grid size once no keystroke has arrived for a while
+            if self.pending_resize is not None and pygame.time.get_ticks() >= self.pending_resize_at:
+                if self.pending_resize != self.grid.width:
+                    self.resize_grid(self.pending_resize)
+                self.pending_resize = None
+            
             # Update UI elements
             for element in self.ui_elements:
                 if hasattr(element, 'update'):